@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import signal
 import sys
-from types import FrameType
-from typing import Optional
+from typing import Any, Coroutine, Optional
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -49,12 +49,8 @@ def _setup_logging(level: str) -> None:
     )
 
 
-def main(argv: Optional[list[str]] = None) -> None:
-    args = _build_parser().parse_args(argv)
-    _setup_logging(args.log_level)
-
+async def _amain(args: argparse.Namespace) -> None:
     logger = logging.getLogger("orion_voice")
-    logger.info("Orion Notes starting (mode=%s)", args.mode)
 
     # Late import so logging is configured before any module-level loggers fire
     from orion_voice.app import OrionVoiceApp
@@ -63,17 +59,21 @@ def main(argv: Optional[list[str]] = None) -> None:
     config = OrionConfig.load()
     app = OrionVoiceApp(config=config)
 
-    # Graceful shutdown on Ctrl+C / SIGTERM
-    def _signal_handler(sig: int, _frame: Optional[FrameType]) -> None:
+    # Graceful shutdown on Ctrl+C / SIGTERM, delivered on the event loop
+    def _on_signal(sig: int) -> None:
         logger.info("Received signal %s, shutting down", signal.Signals(sig).name)
         app.request_shutdown()
 
-    signal.signal(signal.SIGINT, _signal_handler)
-    signal.signal(signal.SIGTERM, _signal_handler)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _on_signal, sig)
+        except NotImplementedError:
+            # Windows event loops have no add_signal_handler
+            signal.signal(sig, lambda s, _frame: loop.call_soon_threadsafe(_on_signal, s))
 
     try:
-        app.start(mode=args.mode, host=args.host, port=args.port)
-        app.wait()
+        await app.run_async(mode=args.mode, host=args.host, port=args.port)
     except Exception:
         logger.exception("Fatal error")
         sys.exit(1)
@@ -81,5 +81,28 @@ def main(argv: Optional[list[str]] = None) -> None:
         app.stop()
 
 
+def main(argv: Optional[list[str]] = None) -> None:
+    args = _build_parser().parse_args(argv)
+    _setup_logging(args.log_level)
+
+    logger = logging.getLogger("orion_voice")
+    logger.info("Orion Notes starting (mode=%s)", args.mode)
+
+    _run(_amain(args))
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run *coro* on uvloop where it is available, else on asyncio's default loop."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            uvloop.run(coro)
+            return
+    asyncio.run(coro)
+
+
 if __name__ == "__main__":
     main()
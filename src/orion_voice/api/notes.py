@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import urllib.parse
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Annotated, Optional
 
 import aiosqlite
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 router = APIRouter(prefix="/api/notes", tags=["notes"])
 
@@ -17,6 +20,13 @@ _data_dir = os.environ.get("ORION_DATA_DIR")
 DB_DIR = Path(_data_dir) if _data_dir else Path.home() / ".orion-voice"
 DB_PATH = DB_DIR / "notes.db"
 
+_UTC = timezone.utc
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(_UTC).isoformat()
+
+
 _CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS notes (
     id TEXT PRIMARY KEY,
@@ -28,22 +38,115 @@ CREATE TABLE IF NOT EXISTS notes (
 )
 """
 
+_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_notes_created_at ON notes(created_at DESC) WHERE deleted = 0",
+    "CREATE INDEX IF NOT EXISTS idx_notes_updated_at ON notes(updated_at)",
+)
+
+# Handlers always pass these exact strings so sqlite3's per-connection
+# statement cache reuses the prepared statements instead of re-parsing.
+_SQL_INSERT_NOTE = (
+    "INSERT INTO notes (id, title, content, created_at, updated_at) VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_SELECT_PAGE = (
+    "SELECT id, title, content, created_at, updated_at, COUNT(*) OVER () FROM notes "
+    "WHERE deleted = 0 ORDER BY created_at DESC LIMIT ? OFFSET ?"
+)
+_SQL_COUNT_LIVE = "SELECT COUNT(*) FROM notes WHERE deleted = 0"
+_SQL_SELECT_BY_ID = (
+    "SELECT id, title, content, created_at, updated_at FROM notes WHERE id = ? AND deleted = 0"
+)
+_SQL_UPDATE_NOTE = (
+    "UPDATE notes SET title = COALESCE(?, title), content = COALESCE(?, content), updated_at = ? "
+    "WHERE id = ? AND deleted = 0 "
+    "RETURNING id, title, content, created_at, updated_at"
+)
+_SQL_SOFT_DELETE = (
+    "UPDATE notes SET deleted = 1, updated_at = ? WHERE id = ? AND deleted = 0 RETURNING id"
+)
+_STATEMENT_CACHE_SIZE = 256
+
+# WAL lets the read-only connection serve GETs while a write is in flight, and
+# synchronous=NORMAL is durable under WAL without an fsync per commit.
+_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+async def _apply_pragmas(db: aiosqlite.Connection, pragmas: tuple[str, ...]) -> None:
+    for pragma in pragmas:
+        await db.execute(pragma)
 
-async def get_db() -> aiosqlite.Connection:
+
+async def open_db() -> aiosqlite.Connection:
+    """Open the long-lived notes connection and ensure the schema exists.
+
+    Called once from the API lifespan; handlers get the connection through
+    :func:`get_db`.
+    """
     DB_DIR.mkdir(parents=True, exist_ok=True)
-    db = await aiosqlite.connect(str(DB_PATH))
+    db = await aiosqlite.connect(str(DB_PATH), cached_statements=_STATEMENT_CACHE_SIZE)
     db.row_factory = aiosqlite.Row
     await db.execute(_CREATE_TABLE)
+    for statement in _CREATE_INDEXES:
+        await db.execute(statement)
     await db.commit()
+    await _apply_pragmas(db, _WRITER_PRAGMAS + _CONNECTION_PRAGMAS)
+    return db
+
+
+async def open_db_reader() -> aiosqlite.Connection:
+    """Open a read-only connection for GET handlers.
+
+    Must be called after :func:`open_db` so the schema and WAL files exist.
+    """
+    uri = f"file:{urllib.parse.quote(DB_PATH.as_posix())}?mode=ro"
+    db = await aiosqlite.connect(uri, uri=True, cached_statements=_STATEMENT_CACHE_SIZE)
+    db.row_factory = aiosqlite.Row
+    await _apply_pragmas(db, _CONNECTION_PRAGMAS)
     return db
 
 
+async def close_db(db: aiosqlite.Connection) -> None:
+    """Refresh planner statistics for the indexes, then close *db*."""
+    await db.execute("PRAGMA optimize")
+    await db.close()
+
+
+def get_db(request: Request) -> aiosqlite.Connection:
+    return request.app.state.db
+
+
+def get_db_reader(request: Request) -> aiosqlite.Connection:
+    return request.app.state.db_reader
+
+
+def get_write_lock(request: Request) -> asyncio.Lock:
+    return request.app.state.db_write_lock
+
+
+Db = Annotated[aiosqlite.Connection, Depends(get_db)]
+DbReader = Annotated[aiosqlite.Connection, Depends(get_db_reader)]
+WriteLock = Annotated[asyncio.Lock, Depends(get_write_lock)]
+
+
 class NoteCreate(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     content: str
     title: str = ""
 
 
 class NoteUpdate(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     content: Optional[str] = None
     title: Optional[str] = None
 
@@ -64,96 +167,68 @@ class NoteListResponse(BaseModel):
 
 
 @router.post("", response_model=NoteOut, status_code=201)
-async def create_note(body: NoteCreate) -> NoteOut:
+async def create_note(body: NoteCreate, db: Db, write_lock: WriteLock) -> NoteOut:
     note_id = uuid.uuid4().hex
-    now = datetime.now(timezone.utc).isoformat()
-    db = await get_db()
-    try:
-        await db.execute(
-            "INSERT INTO notes (id, title, content, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
-            (note_id, body.title, body.content, now, now),
-        )
+    now = _utcnow_iso()
+    async with write_lock:
+        await db.execute(_SQL_INSERT_NOTE, (note_id, body.title, body.content, now, now))
         await db.commit()
-        return NoteOut(id=note_id, title=body.title, content=body.content, created_at=now, updated_at=now)
-    finally:
-        await db.close()
+    return NoteOut(id=note_id, title=body.title, content=body.content, created_at=now, updated_at=now)
 
 
-@router.get("", response_model=NoteListResponse)
+@router.get("", response_model=None, responses={200: {"model": NoteListResponse}})
 async def list_notes(
+    db: DbReader,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-) -> NoteListResponse:
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT COUNT(*) FROM notes WHERE deleted = 0")
-        row = await cursor.fetchone()
-        total = row[0]
-
-        offset = (page - 1) * page_size
-        cursor = await db.execute(
-            "SELECT id, title, content, created_at, updated_at FROM notes "
-            "WHERE deleted = 0 ORDER BY created_at DESC LIMIT ? OFFSET ?",
-            (page_size, offset),
-        )
-        rows = await cursor.fetchall()
-        notes = [NoteOut(id=r[0], title=r[1], content=r[2], created_at=r[3], updated_at=r[4]) for r in rows]
-        return NoteListResponse(notes=notes, total=total, page=page, page_size=page_size)
-    finally:
-        await db.close()
+) -> ORJSONResponse:
+    # Rows come straight from the schema, so skip building NoteOut models and
+    # re-validating them; NoteListResponse only documents the shape.
+    offset = (page - 1) * page_size
+    cursor = await db.execute(_SQL_SELECT_PAGE, (page_size, offset))
+    rows = await cursor.fetchall()
+    if rows:
+        total = rows[0][5]
+    elif offset:
+        # Past the last page the window query yields no rows to carry the total
+        cursor = await db.execute(_SQL_COUNT_LIVE)
+        total = (await cursor.fetchone())[0]
+    else:
+        total = 0
+    notes = [
+        {"id": r[0], "title": r[1], "content": r[2], "created_at": r[3], "updated_at": r[4]}
+        for r in rows
+    ]
+    return ORJSONResponse({"notes": notes, "total": total, "page": page, "page_size": page_size})
 
 
 @router.get("/{note_id}", response_model=NoteOut)
-async def get_note(note_id: str) -> NoteOut:
-    db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT id, title, content, created_at, updated_at FROM notes WHERE id = ? AND deleted = 0",
-            (note_id,),
-        )
-        row = await cursor.fetchone()
-        if row is None:
-            raise HTTPException(status_code=404, detail="Note not found")
-        return NoteOut(id=row[0], title=row[1], content=row[2], created_at=row[3], updated_at=row[4])
-    finally:
-        await db.close()
+async def get_note(note_id: str, db: DbReader) -> NoteOut:
+    cursor = await db.execute(_SQL_SELECT_BY_ID, (note_id,))
+    row = await cursor.fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Note not found")
+    return NoteOut(id=row[0], title=row[1], content=row[2], created_at=row[3], updated_at=row[4])
 
 
 @router.put("/{note_id}", response_model=NoteOut)
-async def update_note(note_id: str, body: NoteUpdate) -> NoteOut:
-    db = await get_db()
-    try:
-        cursor = await db.execute(
-            "SELECT id, title, content, created_at, updated_at FROM notes WHERE id = ? AND deleted = 0",
-            (note_id,),
-        )
+async def update_note(note_id: str, body: NoteUpdate, db: Db, write_lock: WriteLock) -> NoteOut:
+    now = _utcnow_iso()
+    async with write_lock:
+        cursor = await db.execute(_SQL_UPDATE_NOTE, (body.title, body.content, now, note_id))
         row = await cursor.fetchone()
-        if row is None:
-            raise HTTPException(status_code=404, detail="Note not found")
-
-        title = body.title if body.title is not None else row[1]
-        content = body.content if body.content is not None else row[2]
-        now = datetime.now(timezone.utc).isoformat()
-
-        await db.execute(
-            "UPDATE notes SET title = ?, content = ?, updated_at = ? WHERE id = ?",
-            (title, content, now, note_id),
-        )
         await db.commit()
-        return NoteOut(id=note_id, title=title, content=content, created_at=row[3], updated_at=now)
-    finally:
-        await db.close()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Note not found")
+    return NoteOut(id=row[0], title=row[1], content=row[2], created_at=row[3], updated_at=row[4])
 
 
 @router.delete("/{note_id}", status_code=204)
-async def delete_note(note_id: str) -> None:
-    db = await get_db()
-    try:
-        cursor = await db.execute("SELECT id FROM notes WHERE id = ? AND deleted = 0", (note_id,))
-        if await cursor.fetchone() is None:
-            raise HTTPException(status_code=404, detail="Note not found")
-        now = datetime.now(timezone.utc).isoformat()
-        await db.execute("UPDATE notes SET deleted = 1, updated_at = ? WHERE id = ?", (now, note_id))
+async def delete_note(note_id: str, db: Db, write_lock: WriteLock) -> None:
+    now = _utcnow_iso()
+    async with write_lock:
+        cursor = await db.execute(_SQL_SOFT_DELETE, (now, note_id))
+        row = await cursor.fetchone()
         await db.commit()
-    finally:
-        await db.close()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Note not found")
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
 import asyncio
-import io
+import concurrent.futures
+import functools
 import logging
+import shutil
+import struct
+import sys
 import tempfile
-import wave
+import time
 from contextlib import asynccontextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import numpy as np
 from fastapi import FastAPI, HTTPException, UploadFile, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
-from orion_voice.api.notes import router as notes_router
+from orion_voice.api.notes import close_db, open_db, open_db_reader, router as notes_router
 
 from orion_voice.core.config import OrionConfig
 
@@ -39,8 +43,6 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-_tts: Optional[TTSManager] = None
-_stt: Optional[STTEngine] = None
 _recorder: Optional[AudioRecorder] = None
 _config: Optional[OrionConfig] = None
 
@@ -52,28 +54,45 @@ def _get_config() -> OrionConfig:
     return _config
 
 
-def _get_tts() -> TTSManager:
-    global _tts
-    if _tts is None:
-        config = _get_config()
-        _tts = TTSManager()
-        try:
-            _tts.set_voice(config.tts.voice, config.tts.engine)
-        except Exception:
-            logger.warning("Could not set configured voice, using defaults")
-        _tts.set_speed(config.tts.speed)
-    return _tts
+def _create_tts() -> TTSManager:
+    config = _get_config()
+    tts = TTSManager()
+    try:
+        tts.set_voice(config.tts.voice, config.tts.engine)
+    except Exception:
+        logger.warning("Could not set configured voice, using defaults")
+    tts.set_speed(config.tts.speed)
+    return tts
 
 
-def _get_stt() -> STTEngine:
-    global _stt
-    if _stt is None:
-        config = _get_config()
-        _stt = STTEngine(
-            model_size=config.stt.model_size,  # type: ignore[arg-type]
-            device=config.stt.device,
-        )
-    return _stt
+def _create_stt() -> STTEngine:
+    config = _get_config()
+    return STTEngine(
+        model_size=config.stt.model_size,  # type: ignore[arg-type]
+        device=config.stt.device,
+        vad_backend=config.stt.vad_backend,  # type: ignore[arg-type]
+    )
+
+
+def _warm_engines(app: FastAPI) -> None:
+    """Construct the engines and load the STT model before serving requests."""
+    app.state.tts = _create_tts()
+    app.state.stt = _create_stt()
+    app.state.stt.preload()
+
+
+def _get_tts(app: FastAPI) -> TTSManager:
+    tts = getattr(app.state, "tts", None)
+    if tts is None:
+        tts = app.state.tts = _create_tts()
+    return tts
+
+
+def _get_stt(app: FastAPI) -> STTEngine:
+    stt = getattr(app.state, "stt", None)
+    if stt is None:
+        stt = app.state.stt = _create_stt()
+    return stt
 
 
 def _get_recorder() -> AudioRecorder:
@@ -86,21 +105,50 @@ def _get_recorder() -> AudioRecorder:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Orion Notes API starting")
-    yield
-    logger.info("Orion Notes API shutting down")
-    global _tts, _stt, _recorder, _config
-    if _tts:
-        _tts.stop()
-    if _recorder and _recorder.is_recording:
-        _recorder.stop()
-    _tts = None
-    _stt = None
-    _recorder = None
-    _config = None
+    app.state.db = await open_db()
+    app.state.db_reader = await open_db_reader()
+    # SQLite allows one writer at a time; serialise write transactions on the
+    # shared connection so one handler's commit never flushes another's work.
+    app.state.db_write_lock = asyncio.Lock()
+    # Transcription gets its own single worker so a long job cannot starve TTS
+    # and other default-executor work; it is GPU/model bound anyway.
+    app.state.stt_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
+    app.state.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+    app.state.stt_batcher = _TranscriptionBatcher(app)
+    if _HAS_ENGINES:
+        # Pay model loading at startup rather than on the first request
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, _warm_engines, app)
+        except Exception:
+            logger.exception("Failed to preload STT/TTS engines; they will load on first use")
+    try:
+        yield
+    finally:
+        logger.info("Orion Notes API shutting down")
+        global _recorder, _config
+        tts = getattr(app.state, "tts", None)
+        if tts:
+            tts.close()
+        if _recorder and _recorder.is_recording:
+            _recorder.stop()
+        app.state.tts = None
+        app.state.stt = None
+        _recorder = None
+        _config = None
+        app.state.stt_batcher.close()
+        app.state.stt_pool.shutdown(wait=False, cancel_futures=True)
+        app.state.io_pool.shutdown(wait=False, cancel_futures=True)
+        await app.state.db_reader.close()
+        await close_db(app.state.db)
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Orion Notes", version="2.0.0", lifespan=lifespan)
+    app = FastAPI(
+        title="Orion Notes",
+        version="2.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     app.add_middleware(
         CORSMiddleware,
@@ -127,23 +175,57 @@ def create_app() -> FastAPI:
 
 # --- TTS ---
 
+def _wav_header(n_bytes: int, sr: int, ch: int = 1, bits: int = 16) -> bytes:
+    """Return the 44-byte RIFF/WAVE header for *n_bytes* of PCM data."""
+    block_align = ch * bits // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + n_bytes, b"WAVE",
+        b"fmt ", 16, 1, ch, sr, sr * block_align, block_align, bits,
+        b"data", n_bytes,
+    )
+
+
 class SpeakRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     text: str
     stream: bool = False
 
 
 class TTSSettingsUpdate(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     voice: Optional[str] = None
     engine: Optional[str] = None
     speed: Optional[float] = None
     volume: Optional[float] = None
 
 
+# Installed Piper voices only change when a voice is installed, so the list is
+# cached and refreshed lazily. (EdgeVoiceLister caches the Edge catalogue itself.)
+_PIPER_VOICES_TTL_S = 300.0
+_piper_voice_cache: Optional[tuple[float, list[str]]] = None
+_voice_cache_lock = asyncio.Lock()
+
+
+async def _cached_piper_voices() -> list[str]:
+    global _piper_voice_cache
+    async with _voice_cache_lock:
+        hit = _piper_voice_cache
+        if hit is not None and time.monotonic() - hit[0] < _PIPER_VOICES_TTL_S:
+            return hit[1]
+        loop = asyncio.get_running_loop()
+        installed = await loop.run_in_executor(None, lambda: PiperVoiceManager().list_installed())
+        _piper_voice_cache = (time.monotonic(), installed)
+        return installed
+
+
 def register_tts_routes(app: FastAPI) -> None:
 
     @app.post("/api/tts/speak")
     async def tts_speak(body: SpeakRequest):
-        tts = _get_tts()
+        tts = _get_tts(app)
         if not body.text.strip():
             raise HTTPException(status_code=400, detail="Text is required")
 
@@ -151,17 +233,11 @@ def register_tts_routes(app: FastAPI) -> None:
             loop = asyncio.get_running_loop()
             pcm, sr = await loop.run_in_executor(None, tts._synthesize, body.text)
 
-            buf = io.BytesIO()
-            with wave.open(buf, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(sr)
-                wf.writeframes(pcm)
-            buf.seek(0)
-
-            return StreamingResponse(buf, media_type="audio/wav", headers={
-                "Content-Disposition": "inline; filename=speech.wav"
-            })
+            return StreamingResponse(
+                iter([_wav_header(len(pcm), sr), pcm]),
+                media_type="audio/wav",
+                headers={"Content-Disposition": "inline; filename=speech.wav"},
+            )
 
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, tts.speak, body.text)
@@ -169,17 +245,17 @@ def register_tts_routes(app: FastAPI) -> None:
 
     @app.post("/api/tts/stop")
     async def tts_stop():
-        _get_tts().stop()
+        _get_tts(app).stop()
         return {"status": "stopped"}
 
     @app.post("/api/tts/pause")
     async def tts_pause():
-        _get_tts().pause()
+        _get_tts(app).pause()
         return {"status": "paused"}
 
     @app.post("/api/tts/resume")
     async def tts_resume():
-        _get_tts().resume()
+        _get_tts(app).resume()
         return {"status": "resumed"}
 
     @app.get("/api/tts/voices")
@@ -189,16 +265,14 @@ def register_tts_routes(app: FastAPI) -> None:
         if engine in (None, "edge"):
             try:
                 loop = asyncio.get_running_loop()
-                edge_voices = await loop.run_in_executor(None, EdgeVoiceLister.list_voices, language)
-                results["edge"] = edge_voices
+                results["edge"] = await loop.run_in_executor(None, EdgeVoiceLister.list_voices, language)
             except Exception as exc:
                 logger.warning("Failed to list Edge voices: %s", exc)
                 results["edge"] = []
 
         if engine in (None, "piper"):
             try:
-                mgr = PiperVoiceManager()
-                installed = mgr.list_installed()
+                installed = await _cached_piper_voices()
                 results["piper"] = [{"name": v, "installed": True} for v in installed]
             except Exception as exc:
                 logger.warning("Failed to list Piper voices: %s", exc)
@@ -213,13 +287,14 @@ def register_tts_routes(app: FastAPI) -> None:
         text = await loop.run_in_executor(None, read_clipboard)
         if not text or not text.strip():
             raise HTTPException(status_code=400, detail="Clipboard is empty")
-        tts = _get_tts()
+        tts = _get_tts(app)
         await loop.run_in_executor(None, tts.speak, text.strip())
         return {"status": "playing", "text": text.strip()}
 
     @app.put("/api/tts/settings")
     async def tts_update_settings(body: TTSSettingsUpdate):
-        tts = _get_tts()
+        global _piper_voice_cache
+        tts = _get_tts(app)
         config = _get_config()
 
         if body.voice is not None:
@@ -228,6 +303,7 @@ def register_tts_routes(app: FastAPI) -> None:
                 config.tts.voice = body.voice
                 if body.engine:
                     config.tts.engine = body.engine
+                _piper_voice_cache = None
             except Exception as exc:
                 raise HTTPException(status_code=400, detail=str(exc))
 
@@ -244,6 +320,93 @@ def register_tts_routes(app: FastAPI) -> None:
 
 # --- STT ---
 
+def _spool_upload(src: BinaryIO, suffix: str) -> tuple[Path, int]:
+    """Copy an uploaded file to a temp file in 1 MiB blocks; return its path and size."""
+    with tempfile.NamedTemporaryFile(delete=False, prefix="orion_stt_", suffix=suffix) as dst:
+        shutil.copyfileobj(src, dst, length=1 << 20)
+        size = dst.tell()
+    return Path(dst.name), size
+
+
+# Stream audio is transcribed once this much has buffered; a single frame may
+# carry at most _WS_MAX_FRAME_SAMPLES. _WS_SEND_TIMEOUT_S is how long a send
+# may wait on a client that has stopped reading before the socket is given up on.
+_WS_CHUNK_SAMPLES = SAMPLE_RATE * 2
+_WS_MAX_FRAME_SAMPLES = SAMPLE_RATE * 5
+_WS_SEND_TIMEOUT_S = 5.0
+
+
+async def _ws_send(ws: WebSocket, payload: dict) -> None:
+    await asyncio.wait_for(ws.send_json(payload), timeout=_WS_SEND_TIMEOUT_S)
+
+
+# Live transcriptions arriving within this window of each other are decoded as
+# one batch, up to _BATCH_MAX_ITEMS at a time.
+_BATCH_WINDOW_S = 0.02
+_BATCH_MAX_ITEMS = 8
+
+
+class _TranscriptionBatcher:
+    """Coalesces concurrent short transcriptions into ``STTEngine.transcribe_batch`` calls.
+
+    Requests queue up on the event loop; a single drain task waits up to
+    ``_BATCH_WINDOW_S`` for company and runs the batch on the STT pool.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self._app = app
+        self._queue: asyncio.Queue[tuple[np.ndarray, asyncio.Future]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def transcribe(self, audio: np.ndarray) -> TranscriptionResult:
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain())
+        fut = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio, fut))
+        return await fut
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _drain(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_WINDOW_S
+            while len(batch) < _BATCH_MAX_ITEMS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch = [(audio, fut) for audio, fut in batch if not fut.done()]
+            if not batch:
+                continue
+            try:
+                stt = _get_stt(self._app)
+                if len(batch) == 1:
+                    results = [await loop.run_in_executor(
+                        self._app.state.stt_pool, stt.transcribe, batch[0][0]
+                    )]
+                else:
+                    results = await loop.run_in_executor(
+                        self._app.state.stt_pool, stt.transcribe_batch, [a for a, _ in batch]
+                    )
+            except Exception as exc:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(exc)
+                continue
+            for (_, fut), result in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(result)
+
+
 class TranscriptionResponse(BaseModel):
     text: str
     language: Optional[str] = None
@@ -271,8 +434,7 @@ def register_stt_routes(app: FastAPI) -> None:
         audio = await loop.run_in_executor(None, recorder.stop)
         if audio.size == 0:
             return {"status": "stopped", "text": ""}
-        stt = _get_stt()
-        result = await loop.run_in_executor(None, stt.transcribe, audio)
+        result = await app.state.stt_batcher.transcribe(audio)
         return {"status": "stopped", "text": result.text}
 
     @app.post("/api/stt/transcribe", response_model=TranscriptionResponse)
@@ -280,18 +442,17 @@ def register_stt_routes(app: FastAPI) -> None:
         if file.content_type and not file.content_type.startswith(("audio/", "application/octet-stream")):
             raise HTTPException(status_code=400, detail=f"Unsupported content type: {file.content_type}")
 
-        data = await file.read()
-        if not data:
-            raise HTTPException(status_code=400, detail="Empty audio file")
-
         suffix = Path(file.filename or "audio.wav").suffix or ".wav"
-        tmp = Path(tempfile.gettempdir()) / f"orion_stt_{id(data)}{suffix}"
+        loop = asyncio.get_running_loop()
+        tmp, size = await loop.run_in_executor(app.state.io_pool, _spool_upload, file.file, suffix)
         try:
-            tmp.write_bytes(data)
-            stt = _get_stt()
-            loop = asyncio.get_running_loop()
+            if not size:
+                raise HTTPException(status_code=400, detail="Empty audio file")
+            stt = _get_stt(app)
+            # Uploaded files are batch work: use the wider beam
             result: TranscriptionResult = await loop.run_in_executor(
-                None, stt.transcribe, str(tmp), language
+                app.state.stt_pool,
+                functools.partial(stt.transcribe, str(tmp), language, high_quality=True),
             )
             return TranscriptionResponse(
                 text=result.text,
@@ -305,62 +466,58 @@ def register_stt_routes(app: FastAPI) -> None:
     @app.websocket("/api/stt/stream")
     async def stt_stream(ws: WebSocket):
         await ws.accept()
-        stt = _get_stt()
-        audio_buffer: list[bytes] = []
+        # Samples accumulate in one float32 buffer that is overwritten in place.
+        # It is drained whenever it reaches _WS_CHUNK_SAMPLES, so with frames
+        # capped it never needs to grow.
+        buf = np.empty(_WS_CHUNK_SAMPLES + _WS_MAX_FRAME_SAMPLES, dtype=np.float32)
+        n = 0
 
         try:
             while True:
                 message = await ws.receive()
 
                 if "bytes" in message:
-                    chunk = message["bytes"]
-                    audio_buffer.append(chunk)
-
-                    audio_data = b"".join(audio_buffer)
-                    samples = np.frombuffer(audio_data, dtype=np.float32)
-
-                    if len(samples) >= SAMPLE_RATE * 2:
-                        loop = asyncio.get_running_loop()
-                        result: TranscriptionResult = await loop.run_in_executor(
-                            None, stt.transcribe, samples
-                        )
-                        await ws.send_json({
+                    data = message["bytes"]
+                    if len(data) > _WS_MAX_FRAME_SAMPLES * 4:
+                        await ws.close(code=1009, reason="Audio frame too large")
+                        return
+                    arr = np.frombuffer(data, dtype=np.float32)
+                    buf[n:n + arr.size] = arr
+                    n += arr.size
+
+                    if n >= _WS_CHUNK_SAMPLES:
+                        result: TranscriptionResult = await app.state.stt_batcher.transcribe(buf[:n])
+                        await _ws_send(ws, {
                             "type": "transcription",
                             "text": result.text,
                             "language": result.language,
                             "segments": result.segments,
                         })
-                        audio_buffer.clear()
+                        n = 0
 
                 elif "text" in message:
                     text = message["text"]
                     if text == "flush":
-                        if audio_buffer:
-                            audio_data = b"".join(audio_buffer)
-                            samples = np.frombuffer(audio_data, dtype=np.float32)
-                            if samples.size > 0:
-                                loop = asyncio.get_running_loop()
-                                result = await loop.run_in_executor(
-                                    None, stt.transcribe, samples
-                                )
-                                await ws.send_json({
-                                    "type": "transcription",
-                                    "text": result.text,
-                                    "language": result.language,
-                                    "segments": result.segments,
-                                    "final": True,
-                                })
-                            audio_buffer.clear()
+                        if n > 0:
+                            result = await app.state.stt_batcher.transcribe(buf[:n])
+                            await _ws_send(ws, {
+                                "type": "transcription",
+                                "text": result.text,
+                                "language": result.language,
+                                "segments": result.segments,
+                                "final": True,
+                            })
+                            n = 0
                     elif text == "reset":
-                        audio_buffer.clear()
-                        await ws.send_json({"type": "reset", "status": "ok"})
+                        n = 0
+                        await _ws_send(ws, {"type": "reset", "status": "ok"})
 
         except WebSocketDisconnect:
             logger.info("STT WebSocket client disconnected")
         except Exception as exc:
             logger.error("STT WebSocket error: %s", exc)
             try:
-                await ws.send_json({"type": "error", "detail": str(exc)})
+                await _ws_send(ws, {"type": "error", "detail": str(exc)})
             except Exception:
                 pass
 
@@ -376,24 +533,26 @@ def register_config_routes(app: FastAPI) -> None:
     @app.put("/api/config")
     async def update_config(body: dict):
         config = _get_config()
-        for section_key, section_val in body.items():
-            if not hasattr(config, section_key):
-                continue
-            current = getattr(config, section_key)
-            if isinstance(section_val, dict) and hasattr(current, "__dataclass_fields__"):
-                for k, v in section_val.items():
-                    if hasattr(current, k):
-                        setattr(current, k, v)
-            else:
-                setattr(config, section_key, section_val)
+        # Validate before anything is applied or saved, so a bad value can't
+        # leave a config.json that fails to load
+        try:
+            updated = config.merged(body)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc))
+        config.replace_with(updated)
         config.save()
         return asdict(config)
 
 
+# uvloop has no Windows build; httptools does, so only the loop falls back.
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+UVICORN_HTTP = "httptools"
+
+
 def run_server(host: str = "127.0.0.1", port: int = 8000) -> None:
     import uvicorn
     app = create_app()
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(app, host=host, port=port, loop=UVICORN_LOOP, http=UVICORN_HTTP, log_level="info", access_log=False)
 
 
 if __name__ == "__main__":
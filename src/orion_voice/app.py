@@ -1,6 +1,8 @@
 """Application orchestrator for Orion Notes."""
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import logging
 import os
 import subprocess
@@ -30,6 +32,7 @@ class OrionVoiceApp:
         self.stt: object = None  # orion_voice.stt.engine.STTEngine
         self.tts: object = None  # orion_voice.tts.engine.TTSManager
         self.recorder: object = None  # orion_voice.stt.recorder.AudioRecorder
+        self._audio_pool: object = None  # orion_voice.stt.recorder.AudioBufferPool
 
         # Hotkey manager (always constructed, but only started in desktop/headless)
         self.hotkeys: HotkeyManager = HotkeyManager()
@@ -38,8 +41,17 @@ class OrionVoiceApp:
         self._server_thread: Optional[threading.Thread] = None
         self._electron_proc: Optional[subprocess.Popen[bytes]] = None
         self._shutdown_event: threading.Event = threading.Event()
+        self._stopped: bool = False
         self._recording_lock: threading.Lock = threading.Lock()
+        # Set while a hotkey recording is in progress; only flipped under
+        # _recording_lock so start/stop transitions can't interleave.
+        self._recording_active: threading.Event = threading.Event()
         self._uvicorn_server: object = None
+        # Transcriptions and clipboard reads run here rather than on a fresh
+        # thread per hotkey press; two workers bound the backlog if keys are mashed.
+        self._workers = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="orion-bg"
+        )
 
     # ------------------------------------------------------------------
     # Lazy engine initialisation
@@ -48,17 +60,39 @@ class OrionVoiceApp:
     def _init_engines(self) -> None:
         """Import and create STT / TTS engines."""
         from orion_voice.stt.engine import STTEngine  # type: ignore[import-untyped]
-        from orion_voice.stt.recorder import AudioRecorder  # type: ignore[import-untyped]
+        from orion_voice.stt.recorder import (  # type: ignore[import-untyped]
+            AudioBufferPool,
+            AudioRecorder,
+        )
         from orion_voice.tts.engine import TTSManager  # type: ignore[import-untyped]
 
         self.stt = STTEngine(
             model_size=self.config.stt.model_size,
             device=self.config.stt.device,
+            vad_backend=self.config.stt.vad_backend,  # type: ignore[arg-type]
             on_final=self._on_transcription,
         )
         self.tts = TTSManager()
         self._configure_tts()
-        self.recorder = AudioRecorder()
+        # One pooled capture buffer per background worker
+        self._audio_pool = AudioBufferPool(count=2)
+        self.recorder = AudioRecorder(buffer_pool=self._audio_pool)
+
+        if self.config.warmup_engines:
+            threading.Thread(target=self._warmup, name="engine-warmup", daemon=True).start()
+
+    def _warmup(self) -> None:
+        """Load the models before the first hotkey press instead of on it."""
+        try:
+            # Loading includes the model's throwaway warmup decode
+            self.stt.preload()  # type: ignore[union-attr]
+        except Exception:
+            logger.warning("STT warmup failed", exc_info=True)
+        try:
+            self.tts.preload()  # type: ignore[union-attr]
+        except Exception:
+            logger.debug("TTS warmup failed", exc_info=True)
+        logger.info("Engine warmup finished")
 
     # ------------------------------------------------------------------
     # Configuration helpers
@@ -77,40 +111,44 @@ class OrionVoiceApp:
 
     def _start_recording(self) -> None:
         with self._recording_lock:
-            if self.recorder is None or self.recorder.is_recording:  # type: ignore[union-attr]
+            if self.recorder is None or self._recording_active.is_set():
                 return
             logger.info("Recording started (hotkey)")
             try:
                 self.recorder.start()  # type: ignore[union-attr]
             except RuntimeError as exc:
                 logger.error("Failed to start recording: %s", exc)
+                return
+            self._recording_active.set()
 
     def _stop_recording(self) -> None:
         with self._recording_lock:
-            if self.recorder is None or not self.recorder.is_recording:  # type: ignore[union-attr]
+            if self.recorder is None or not self._recording_active.is_set():
                 return
+            self._recording_active.clear()
             logger.info("Recording stopped (hotkey)")
             audio = self.recorder.stop()  # type: ignore[union-attr]
 
         if audio.size == 0:
             logger.info("No audio captured")
+            self._audio_pool.release(audio)  # type: ignore[union-attr]
             return
 
-        # Transcribe in a background thread so the hotkey listener is not blocked
-        threading.Thread(
-            target=self._transcribe_and_insert,
-            args=(audio,),
-            daemon=True,
-        ).start()
+        # Transcribe on a worker so the hotkey listener is not blocked
+        self._workers.submit(self._transcribe_and_insert, audio)
 
     def _transcribe_and_insert(self, audio: object) -> None:
         try:
-            result = self.stt.transcribe(audio, language=self.config.stt.language)  # type: ignore[union-attr]
+            result = self.stt.transcribe(  # type: ignore[union-attr]
+                audio, language=self.config.stt.language, without_timestamps=True
+            )
             if result.text.strip():
                 logger.info("Transcription: %s", result.text)
                 insert_at_cursor(result.text)
         except Exception:
             logger.exception("Transcription failed")
+        finally:
+            self._audio_pool.release(audio)  # type: ignore[union-attr]
 
     def _on_transcription(self, result: object) -> None:
         """Called by STTEngine.on_final when streaming transcription completes."""
@@ -121,7 +159,7 @@ class OrionVoiceApp:
     # ------------------------------------------------------------------
 
     def _read_clipboard_and_speak(self) -> None:
-        threading.Thread(target=self._do_read_clipboard, daemon=True).start()
+        self._workers.submit(self._do_read_clipboard)
 
     def _do_read_clipboard(self) -> None:
         try:
@@ -171,18 +209,32 @@ class OrionVoiceApp:
     # API server (FastAPI via uvicorn)
     # ------------------------------------------------------------------
 
-    def _run_server(self, host: str, port: int) -> None:
+    def _build_server(self, host: str, port: int) -> object:
         import uvicorn
 
-        from orion_voice.api.server import create_app  # type: ignore[import-untyped]
+        from orion_voice.api.server import (  # type: ignore[import-untyped]
+            UVICORN_HTTP,
+            UVICORN_LOOP,
+            create_app,
+        )
 
         fastapi_app = create_app()
         server_config = uvicorn.Config(
-            fastapi_app, host=host, port=port, log_level="info",
+            fastapi_app,
+            host=host,
+            port=port,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
+            log_level="info",
+            access_log=False,
+            workers=1,
         )
         server = uvicorn.Server(server_config)
         self._uvicorn_server = server
-        server.run()
+        return server
+
+    def _run_server(self, host: str, port: int) -> None:
+        self._build_server(host, port).run()  # type: ignore[attr-defined]
 
     def _start_api_server(self, host: str, port: int) -> None:
         """Start the FastAPI server in a background daemon thread."""
@@ -246,6 +298,45 @@ class OrionVoiceApp:
         # Always start the API server
         self._start_api_server(host=host, port=port)
 
+        self._start_frontends(mode, port)
+        logger.info("Orion Notes is running")
+
+    async def run_async(
+        self,
+        mode: str = "server",
+        host: str = "127.0.0.1",
+        port: int = 8432,
+    ) -> None:
+        """Run in *mode* on the current event loop until shutdown.
+
+        Unlike :meth:`start`, the API server is served on the calling loop
+        instead of on its own thread and event loop. Returns when shutdown is
+        requested or the server exits, after stopping everything.
+        """
+        logger.info("Starting Orion Notes in '%s' mode", mode)
+        loop = asyncio.get_running_loop()
+
+        server = self._build_server(host, port)
+        server_task = asyncio.create_task(server.serve(), name="uvicorn")  # type: ignore[attr-defined]
+        logger.info("API server starting on %s:%d", host, port)
+
+        try:
+            # Engine construction and the hotkey hook block, keep them off the loop
+            if mode in ("desktop", "headless"):
+                await loop.run_in_executor(None, self._init_engines)
+            await loop.run_in_executor(None, self._start_frontends, mode, port)
+            logger.info("Orion Notes is running")
+
+            shutdown = asyncio.ensure_future(self.wait_async())
+            await asyncio.wait((server_task, shutdown), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.stop()
+            try:
+                await asyncio.wait_for(server_task, timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("API server did not shut down in time")
+
+    def _start_frontends(self, mode: str, port: int) -> None:
         # Register hotkeys for desktop and headless modes
         if mode in ("desktop", "headless"):
             self._register_hotkeys()
@@ -255,8 +346,6 @@ class OrionVoiceApp:
         if mode == "desktop":
             self._launch_electron(port=port)
 
-        logger.info("Orion Notes is running")
-
     def wait(self) -> None:
         """Block until shutdown is signalled."""
         try:
@@ -264,11 +353,16 @@ class OrionVoiceApp:
         except KeyboardInterrupt:
             pass
 
+    async def wait_async(self) -> None:
+        """Await shutdown without blocking the calling event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self._shutdown_event.wait)
+
     def stop(self) -> None:
         """Gracefully shut down all components."""
-        if self._shutdown_event.is_set():
+        if self._stopped:
             # Avoid double-stop
             return
+        self._stopped = True
         self._shutdown_event.set()
 
         logger.info("Shutting down Orion Notes")
@@ -280,9 +374,12 @@ class OrionVoiceApp:
         if self.recorder is not None and getattr(self.recorder, "is_recording", False):
             self.recorder.stop()  # type: ignore[union-attr]
 
-        # Stop TTS playback
+        # Stop TTS playback and the Edge engine's loop thread
         if self.tts is not None:
-            self.tts.stop()  # type: ignore[union-attr]
+            self.tts.close()  # type: ignore[union-attr]
+
+        # Drop queued transcriptions / clipboard reads
+        self._workers.shutdown(wait=False, cancel_futures=True)
 
         # Terminate Electron
         if self._electron_proc is not None:
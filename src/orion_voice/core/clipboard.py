@@ -1,27 +1,96 @@
 from __future__ import annotations
 
+import ctypes
 import threading
 import time
-from typing import Callable, Optional
+from ctypes import wintypes
+from typing import Any, Callable, Optional
 
-import win32clipboard
-import win32con
-import win32api
-import win32gui
+# The pywin32 modules are bound by _load_win32() on first use, so importing
+# this module (e.g. in server mode, or off Windows) doesn't pull them in.
+win32clipboard: Any = None
+win32con: Any = None
+win32api: Any = None
+win32gui: Any = None
+_user32: Any = None
+_kernel32: Any = None
 
 
-def read_clipboard() -> str:
-    win32clipboard.OpenClipboard()
+def _load_win32() -> None:
+    global win32clipboard, win32con, win32api, win32gui, _user32, _kernel32
+    if win32gui is not None:
+        return
+    import win32api as _win32api
+    import win32clipboard as _win32clipboard
+    import win32con as _win32con
+    import win32gui as _win32gui
+
+    # Raw prototypes for reading clipboard text straight out of its HGLOBAL
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.GetClipboardData.argtypes = [wintypes.UINT]
+    _user32.GetClipboardData.restype = wintypes.HANDLE
+    _user32.CountClipboardFormats.argtypes = []
+    _user32.CountClipboardFormats.restype = ctypes.c_int
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalLock.restype = wintypes.LPVOID
+    _kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    _kernel32.GlobalUnlock.restype = wintypes.BOOL
+
+    win32clipboard = _win32clipboard
+    win32con = _win32con
+    win32api = _win32api
+    win32gui = _win32gui
+
+
+def _get_text() -> str:
+    """Read CF_UNICODETEXT from the already-open clipboard, or "" if there is none."""
+    if not win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+        return ""
+    handle = _user32.GetClipboardData(win32con.CF_UNICODETEXT)
+    if not handle:
+        return ""
+    ptr = _kernel32.GlobalLock(handle)
+    if not ptr:
+        return ""
     try:
-        if win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
-            return str(win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT))
+        return ctypes.wstring_at(ptr)
+    finally:
+        _kernel32.GlobalUnlock(handle)
+
+
+# Another process (often whoever just set the clipboard) can hold it open for
+# a moment; OpenClipboard is retried this many times, this far apart.
+_OPEN_ATTEMPTS = 10
+_OPEN_RETRY_S = 0.01
+
+
+def _open_clipboard() -> None:
+    for attempt in range(_OPEN_ATTEMPTS):
+        try:
+            win32clipboard.OpenClipboard()
+            return
+        except win32clipboard.error:
+            if attempt == _OPEN_ATTEMPTS - 1:
+                raise
+            time.sleep(_OPEN_RETRY_S)
+
+
+def read_clipboard() -> str:
+    _load_win32()
+    # An empty clipboard needs no OpenClipboard round-trip at all
+    if _user32.CountClipboardFormats() == 0:
         return ""
+    _open_clipboard()
+    try:
+        return _get_text()
     finally:
         win32clipboard.CloseClipboard()
 
 
 def write_clipboard(text: str) -> None:
-    win32clipboard.OpenClipboard()
+    _load_win32()
+    _open_clipboard()
     try:
         win32clipboard.EmptyClipboard()
         win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
@@ -29,45 +98,270 @@ def write_clipboard(text: str) -> None:
         win32clipboard.CloseClipboard()
 
 
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_EXTENDEDKEY = 0x0001
+_KEYEVENTF_KEYUP = 0x0002
+_VK_CONTROL = 0x11
+_VK_V = 0x56
+# Left/right Shift, Alt and Win, with the flags their key-ups need
+_HELD_MODIFIERS = (
+    (0xA0, 0),
+    (0xA1, 0),
+    (0xA4, 0),
+    (0xA5, _KEYEVENTF_EXTENDEDKEY),
+    (0x5B, _KEYEVENTF_EXTENDEDKEY),
+    (0x5C, _KEYEVENTF_EXTENDEDKEY),
+)
+
+# SendInput delivers keystrokes asynchronously, so the target reads the
+# clipboard some time after we return. The previous contents go back on a
+# timer this long after the paste, off the caller's thread; slow targets
+# such as Electron apps can take well over 50 ms to handle Ctrl+V.
+_RESTORE_DELAY_S = 0.4
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # The mouse/hardware members are only here so sizeof(INPUT) matches what
+    # SendInput expects as cbSize.
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT), ("hi", _HARDWAREINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+
+def _key_input(vk: int, flags: int = 0) -> _INPUT:
+    return _INPUT(type=_INPUT_KEYBOARD, u=_INPUTUNION(ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+
+def _send_ctrl_v() -> bool:
+    user32 = ctypes.windll.user32
+    # Let go of modifiers the hotkey left held (Shift from ctrl+shift+a, say),
+    # or the target sees Ctrl+Shift+V. Ctrl goes down first, so releasing a
+    # held Alt doesn't count as a lone Alt press and open the window's menu.
+    releases = [
+        _key_input(vk, flags | _KEYEVENTF_KEYUP)
+        for vk, flags in _HELD_MODIFIERS
+        if user32.GetAsyncKeyState(vk) & 0x8000
+    ]
+    keys = (_INPUT * (len(releases) + 4))(
+        _key_input(_VK_CONTROL),
+        *releases,
+        _key_input(_VK_V),
+        _key_input(_VK_V, _KEYEVENTF_KEYUP),
+        _key_input(_VK_CONTROL, _KEYEVENTF_KEYUP),
+    )
+    sent = user32.SendInput(len(keys), keys, ctypes.sizeof(_INPUT))
+    return sent == len(keys)
+
+
+def _read_and_replace(text: str) -> str:
+    """Swap ``text`` onto the clipboard and return what was there, in one open/close."""
+    _load_win32()
+    _open_clipboard()
+    try:
+        previous = _get_text()
+        win32clipboard.EmptyClipboard()
+        win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
+        return previous
+    finally:
+        win32clipboard.CloseClipboard()
+
+
+# (timer, text to restore) for the restore still waiting to run, if any
+_pending_restore: Optional[tuple[threading.Timer, str]] = None
+_restore_lock = threading.Lock()
+
+
+def _restore_clipboard(previous: str, seq: int) -> None:
+    global _pending_restore
+    with _restore_lock:
+        if _pending_restore is not None and _pending_restore[1] is previous:
+            _pending_restore = None
+    # Leave the clipboard alone if anything else was copied since the paste
+    if win32clipboard.GetClipboardSequenceNumber() != seq:
+        return
+    try:
+        write_clipboard(previous)
+    except Exception:
+        pass
+
+
 def insert_at_cursor(text: str) -> None:
-    previous = read_clipboard()
-    write_clipboard(text)
-    hwnd = win32gui.GetForegroundWindow()
-    if hwnd:
-        win32api.SendMessage(hwnd, win32con.WM_PASTE, 0, 0)
-        time.sleep(0.05)
-    write_clipboard(previous)
+    global _pending_restore
+    with _restore_lock:
+        pending, _pending_restore = _pending_restore, None
+    if pending is not None:
+        pending[0].cancel()
+    previous = _read_and_replace(text)
+    if pending is not None:
+        # The clipboard still holds the last dictation; what goes back is
+        # what the user had before that one
+        previous = pending[1]
+    pasted = bool(win32gui.GetForegroundWindow()) and _send_ctrl_v()
+    # Nothing to put back if the clipboard held no text or already held this text
+    if not previous or previous == text:
+        return
+    if not pasted:
+        write_clipboard(previous)
+        return
+    timer = threading.Timer(
+        _RESTORE_DELAY_S,
+        _restore_clipboard,
+        (previous, win32clipboard.GetClipboardSequenceNumber()),
+    )
+    timer.daemon = True
+    with _restore_lock:
+        _pending_restore = (timer, previous)
+    timer.start()
+
+
+WM_CLIPBOARDUPDATE = 0x031D
+_HWND_MESSAGE = -3
+# A change whose read failed is retried on this window timer
+_RETRY_TIMER_ID = 1
+_RETRY_INTERVAL_MS = 250
 
 
 class ClipboardMonitor:
+    """Fires ``callback`` with the new text whenever the clipboard changes.
+
+    Change notifications come from ``AddClipboardFormatListener`` on a hidden
+    message-only window, so the worker thread sleeps in the message loop until
+    the clipboard actually changes. If the window or listener can't be set up
+    it falls back to polling every ``poll_interval`` seconds.
+    """
+
     def __init__(self, callback: Callable[[str], None], poll_interval: float = 0.5) -> None:
         self._callback = callback
         self._interval = poll_interval
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._hwnd: Optional[int] = None
+        self._ready = threading.Event()
         self._last_content: str = ""
+        self._last_seq: int = 0
 
     def start(self) -> None:
         if self._running:
             return
+        _load_win32()
         self._running = True
+        self._last_seq = win32clipboard.GetClipboardSequenceNumber()
         self._last_content = read_clipboard()
-        self._thread = threading.Thread(target=self._poll, daemon=True)
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
+        self._ready.wait(timeout=2.0)
 
     def stop(self) -> None:
         self._running = False
+        if self._hwnd is not None:
+            win32gui.PostMessage(self._hwnd, win32con.WM_CLOSE, 0, 0)
         if self._thread is not None:
             self._thread.join(timeout=2.0)
             self._thread = None
 
-    def _poll(self) -> None:
-        while self._running:
+    def _run(self) -> None:
+        try:
+            hwnd, class_atom, hinst = self._create_window()
+        except Exception:
+            self._ready.set()
+            self._poll()
+            return
+
+        self._hwnd = hwnd
+        self._ready.set()
+        try:
+            win32gui.PumpMessages()
+        finally:
+            self._hwnd = None
+            win32gui.UnregisterClass(class_atom, hinst)
+
+    def _create_window(self) -> tuple[int, int, int]:
+        hinst = win32api.GetModuleHandle(None)
+        wc = win32gui.WNDCLASS()
+        wc.lpfnWndProc = self._wnd_proc
+        wc.lpszClassName = f"OrionVoiceClipboardMonitor{id(self)}"
+        wc.hInstance = hinst
+        class_atom = win32gui.RegisterClass(wc)
+        hwnd = win32gui.CreateWindowEx(
+            0, class_atom, "", 0, 0, 0, 0, 0, _HWND_MESSAGE, 0, hinst, None
+        )
+        if not ctypes.windll.user32.AddClipboardFormatListener(hwnd):
+            win32gui.DestroyWindow(hwnd)
+            win32gui.UnregisterClass(class_atom, hinst)
+            raise OSError("AddClipboardFormatListener failed")
+        return hwnd, class_atom, hinst
+
+    def _wnd_proc(self, hwnd: int, msg: int, wparam: int, lparam: int) -> int:
+        if msg == WM_CLIPBOARDUPDATE or msg == win32con.WM_TIMER:
+            if msg == win32con.WM_TIMER:
+                ctypes.windll.user32.KillTimer(hwnd, _RETRY_TIMER_ID)
+            if not self._check():
+                # No further notification comes for this change, so retry it
+                ctypes.windll.user32.SetTimer(hwnd, _RETRY_TIMER_ID, _RETRY_INTERVAL_MS, None)
+            return 0
+        if msg == win32con.WM_CLOSE:
+            ctypes.windll.user32.RemoveClipboardFormatListener(hwnd)
+            win32gui.DestroyWindow(hwnd)
+            return 0
+        if msg == win32con.WM_DESTROY:
+            win32gui.PostQuitMessage(0)
+            return 0
+        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+    def _check(self) -> bool:
+        """Report a clipboard change, if any; False if it couldn't be read."""
+        # The sequence number bumps on every clipboard change; only open the
+        # clipboard and copy the text out when it moved.
+        seq = win32clipboard.GetClipboardSequenceNumber()
+        if seq == self._last_seq:
+            return True
+        try:
+            current = read_clipboard()
+        except Exception:
+            # Left unrecorded, so the next check reads this change again
+            return False
+        self._last_seq = seq
+        if current and current != self._last_content:
+            self._last_content = current
             try:
-                current = read_clipboard()
-                if current and current != self._last_content:
-                    self._last_content = current
-                    self._callback(current)
+                self._callback(current)
             except Exception:
                 pass
+        return True
+
+    def _poll(self) -> None:
+        while self._running:
+            self._check()
             time.sleep(self._interval)
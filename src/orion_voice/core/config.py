@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import json
+import logging
 import os
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
+import msgspec
+
+logger = logging.getLogger(__name__)
 
 _data_dir = os.environ.get("ORION_DATA_DIR")
 CONFIG_DIR = Path(_data_dir) if _data_dir else Path.home() / ".orion-voice"
@@ -26,6 +29,7 @@ class STTSettings:
     model_size: str = "base"
     language: Optional[str] = None
     device: str = "auto"
+    vad_backend: str = "energy"
 
 
 @dataclass
@@ -43,10 +47,11 @@ class OrionConfig:
     hotkeys: HotkeySettings = field(default_factory=HotkeySettings)
     auto_start: bool = False
     minimize_to_tray: bool = True
+    warmup_engines: bool = True
 
     def save(self, path: Path = CONFIG_PATH) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        path.write_bytes(msgspec.json.format(msgspec.json.encode(self), indent=2))
 
     @classmethod
     def load(cls, path: Path = CONFIG_PATH) -> OrionConfig:
@@ -55,14 +60,37 @@ class OrionConfig:
             config.save(path)
             return config
 
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls(
-            stt=STTSettings(**data.get("stt", {})),
-            tts=TTSSettings(**data.get("tts", {})),
-            hotkeys=HotkeySettings(**data.get("hotkeys", {})),
-            auto_start=data.get("auto_start", False),
-            minimize_to_tray=data.get("minimize_to_tray", True),
-        )
+        # msgspec decodes straight into the nested dataclasses; missing keys
+        # take the field defaults and unknown keys are ignored. Lax mode
+        # accepts e.g. "1.2" for a float, as older saves could contain.
+        try:
+            return msgspec.json.decode(path.read_bytes(), type=cls, strict=False)
+        except (msgspec.ValidationError, msgspec.DecodeError) as exc:
+            logger.warning("Ignoring invalid config %s, using defaults: %s", path, exc)
+            return cls()
+
+    def merged(self, changes: dict) -> OrionConfig:
+        """A validated copy with *changes* applied, nested by section like the JSON.
+
+        Unknown keys are ignored; raises ValueError if a value has the wrong type.
+        """
+        data = msgspec.to_builtins(self)
+        for key, value in changes.items():
+            if key not in data:
+                continue
+            if isinstance(value, dict) and isinstance(data[key], dict):
+                data[key].update((k, v) for k, v in value.items() if k in data[key])
+            else:
+                data[key] = value
+        try:
+            return msgspec.convert(data, type=type(self), strict=False)
+        except msgspec.ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+    def replace_with(self, other: OrionConfig) -> None:
+        """Take every setting from *other*, keeping this object's identity."""
+        for f in fields(self):
+            setattr(self, f.name, getattr(other, f.name))
 
     def update(self, **kwargs: object) -> None:
         for key, value in kwargs.items():
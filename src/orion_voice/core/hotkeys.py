@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 import threading
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from pynput import keyboard
+if TYPE_CHECKING:
+    from pynput import keyboard
 
 
 class HotkeyMode(Enum):
@@ -21,87 +23,159 @@ class HotkeyBinding:
     mode: HotkeyMode = HotkeyMode.HOLD
 
 
-def _parse_keys(combo: str) -> frozenset[keyboard.Key | keyboard.KeyCode]:
-    mapping: dict[str, keyboard.Key] = {
-        "ctrl": keyboard.Key.ctrl_l,
-        "shift": keyboard.Key.shift,
-        "alt": keyboard.Key.alt_l,
-        "cmd": keyboard.Key.cmd,
-        "space": keyboard.Key.space,
-        "tab": keyboard.Key.tab,
-        "enter": keyboard.Key.enter,
-        "esc": keyboard.Key.esc,
-    }
+MOD_CTRL = 1
+MOD_SHIFT = 2
+MOD_ALT = 4
+MOD_CMD = 8
+
+# Filled in by _get_kb() the first time pynput is actually needed. Keyed on
+# pynput's canonical modifiers (Key.ctrl, not Key.ctrl_l/ctrl_r), which is
+# what both HotKey.parse() and Listener.canonical() produce.
+_MOD_BITS: dict[keyboard.Key, int] = {}
+
+_kb = None
+
+
+def _get_kb():
+    """Import pynput on first use; server mode never needs it."""
+    global _kb
+    if _kb is None:
+        from pynput import keyboard as kb
+
+        _MOD_BITS.update({
+            kb.Key.ctrl: MOD_CTRL,
+            kb.Key.shift: MOD_SHIFT,
+            kb.Key.alt: MOD_ALT,
+            kb.Key.cmd: MOD_CMD,
+        })
+        _kb = kb
+    return _kb
+
+
+def _canonical_combo(combo: str) -> str:
+    """Rewrite ``"ctrl+shift+a"`` in pynput's hotkey syntax, ``"<ctrl>+<shift>+a"``."""
     parts = [p.strip().lower() for p in combo.split("+")]
-    keys: list[keyboard.Key | keyboard.KeyCode] = []
-    for part in parts:
-        if part in mapping:
-            keys.append(mapping[part])
-        elif len(part) == 1:
-            keys.append(keyboard.KeyCode.from_char(part))
-        else:
-            raise ValueError(f"Unknown key: {part}")
-    return frozenset(keys)
+    return "+".join(p if len(p) == 1 else f"<{p}>" for p in parts)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_keys(combo: str) -> tuple[int, Optional[keyboard.Key | keyboard.KeyCode]]:
+    """Parse ``"ctrl+shift+a"`` into a modifier bitmask and its trigger key.
+
+    Parsing goes through ``keyboard.HotKey.parse`` so the keys compare equal to
+    what ``Listener.canonical`` yields for live events. The trigger is None for
+    modifier-only combos.
+    """
+    kb = _get_kb()
+    try:
+        keys = kb.HotKey.parse(_canonical_combo(combo))
+    except ValueError as exc:
+        raise ValueError(f"Unknown key in hotkey {combo!r}: {exc}") from None
+    mask = 0
+    trigger: Optional[keyboard.Key | keyboard.KeyCode] = None
+    for key in keys:
+        bit = _MOD_BITS.get(key, 0)
+        if bit:
+            mask |= bit
+            continue
+        if trigger is not None:
+            raise ValueError(f"Hotkey has more than one non-modifier key: {combo}")
+        trigger = key
+    return mask, trigger
 
 
 class HotkeyManager:
     def __init__(self) -> None:
         self._bindings: dict[str, HotkeyBinding] = {}
-        self._pressed: set[keyboard.Key | keyboard.KeyCode] = set()
+        # (modifier mask, trigger key) per binding, computed once at register()
+        self._parsed: dict[str, tuple[int, Optional[keyboard.Key | keyboard.KeyCode]]] = {}
+        # Binding names keyed by their trigger key, so a key press only checks
+        # the bindings it can complete. Modifier-only combos are kept in
+        # _untriggered and checked on every modifier press.
+        self._trigger_index: dict[keyboard.Key | keyboard.KeyCode, list[str]] = {}
+        self._untriggered: list[str] = []
+        self._mod_mask = 0
         self._active_holds: set[str] = set()
         self._active_toggles: set[str] = set()
         self._listener: Optional[keyboard.Listener] = None
+        self._canonical: Callable[[keyboard.Key | keyboard.KeyCode], keyboard.Key | keyboard.KeyCode] = (
+            lambda key: key
+        )
         self._lock = threading.Lock()
 
     def register(self, name: str, binding: HotkeyBinding) -> None:
+        parsed = _parse_keys(binding.keys)
+        trigger = parsed[1]
         with self._lock:
+            self._unindex(name)
             self._bindings[name] = binding
+            self._parsed[name] = parsed
+            if trigger is None:
+                self._untriggered.append(name)
+            else:
+                self._trigger_index.setdefault(trigger, []).append(name)
 
     def unregister(self, name: str) -> None:
         with self._lock:
+            self._unindex(name)
             self._bindings.pop(name, None)
+            self._parsed.pop(name, None)
             self._active_holds.discard(name)
             self._active_toggles.discard(name)
 
-    def _normalize_key(self, key: keyboard.Key | keyboard.KeyCode) -> keyboard.Key | keyboard.KeyCode:
-        if isinstance(key, keyboard.Key):
-            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r):
-                return keyboard.Key.ctrl_l
-            if key in (keyboard.Key.alt_l, keyboard.Key.alt_r):
-                return keyboard.Key.alt_l
-            if key in (keyboard.Key.shift, keyboard.Key.shift_l, keyboard.Key.shift_r):
-                return keyboard.Key.shift
-        if isinstance(key, keyboard.KeyCode) and key.char:
-            return keyboard.KeyCode.from_char(key.char.lower())
-        return key
+    def _unindex(self, name: str) -> None:
+        parsed = self._parsed.get(name)
+        if parsed is None:
+            return
+        trigger = parsed[1]
+        if trigger is None:
+            self._untriggered.remove(name)
+            return
+        names = self._trigger_index[trigger]
+        names.remove(name)
+        if not names:
+            del self._trigger_index[trigger]
 
     def _on_press(self, key: keyboard.Key | keyboard.KeyCode) -> None:
-        nk = self._normalize_key(key)
-        self._pressed.add(nk)
+        key = self._canonical(key)
+        bit = _MOD_BITS.get(key, 0)
+        if bit:
+            self._mod_mask |= bit
+            with self._lock:
+                for name in self._untriggered:
+                    self._check_activate(name)
+            return
 
         with self._lock:
-            for name, binding in self._bindings.items():
-                required = _parse_keys(binding.keys)
-                if not required.issubset(self._pressed):
-                    continue
-
-                if binding.mode == HotkeyMode.HOLD:
-                    if name not in self._active_holds:
-                        self._active_holds.add(name)
-                        binding.on_activate()
+            for name in self._trigger_index.get(key, ()):
+                self._check_activate(name)
 
-                elif binding.mode == HotkeyMode.TOGGLE:
-                    if name in self._active_toggles:
-                        self._active_toggles.discard(name)
-                        if binding.on_deactivate:
-                            binding.on_deactivate()
-                    else:
-                        self._active_toggles.add(name)
-                        binding.on_activate()
+    def _check_activate(self, name: str) -> None:
+        req_mask = self._parsed[name][0]
+        if self._mod_mask & req_mask != req_mask:
+            return
+        binding = self._bindings[name]
+
+        if binding.mode == HotkeyMode.HOLD:
+            if name not in self._active_holds:
+                self._active_holds.add(name)
+                binding.on_activate()
+
+        elif binding.mode == HotkeyMode.TOGGLE:
+            if name in self._active_toggles:
+                self._active_toggles.discard(name)
+                if binding.on_deactivate:
+                    binding.on_deactivate()
+            else:
+                self._active_toggles.add(name)
+                binding.on_activate()
 
     def _on_release(self, key: keyboard.Key | keyboard.KeyCode) -> None:
-        nk = self._normalize_key(key)
-        self._pressed.discard(nk)
+        key = self._canonical(key)
+        bit = _MOD_BITS.get(key, 0)
+        if bit:
+            self._mod_mask &= ~bit
+            key = None
 
         with self._lock:
             for name in list(self._active_holds):
@@ -109,8 +183,8 @@ class HotkeyManager:
                 if binding is None:
                     self._active_holds.discard(name)
                     continue
-                required = _parse_keys(binding.keys)
-                if not required.issubset(self._pressed):
+                req_mask, trigger = self._parsed[name]
+                if self._mod_mask & req_mask != req_mask or (trigger is not None and key == trigger):
                     self._active_holds.discard(name)
                     if binding.on_deactivate:
                         binding.on_deactivate()
@@ -118,10 +192,13 @@ class HotkeyManager:
     def start(self) -> None:
         if self._listener is not None:
             return
-        self._listener = keyboard.Listener(
+        # A plain Listener rather than GlobalHotKeys: HOLD bindings need the
+        # release events, which GlobalHotKeys doesn't expose.
+        self._listener = _get_kb().Listener(
             on_press=self._on_press,
             on_release=self._on_release,
         )
+        self._canonical = self._listener.canonical
         self._listener.daemon = True
         self._listener.start()
 
@@ -129,7 +206,7 @@ class HotkeyManager:
         if self._listener is not None:
             self._listener.stop()
             self._listener = None
-            self._pressed.clear()
+            self._mod_mask = 0
             self._active_holds.clear()
 
 
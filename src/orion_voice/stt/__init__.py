@@ -1,10 +1,12 @@
-from orion_voice.stt.engine import STTEngine, TranscriptionResult, EnergyVAD
-from orion_voice.stt.recorder import AudioRecorder, PushToTalkRecorder
+from orion_voice.stt.engine import STTEngine, TranscriptionResult, EnergyVAD, SileroVAD
+from orion_voice.stt.recorder import AudioBufferPool, AudioRecorder, PushToTalkRecorder
 
 __all__ = [
     "STTEngine",
     "TranscriptionResult",
     "EnergyVAD",
+    "SileroVAD",
+    "AudioBufferPool",
     "AudioRecorder",
     "PushToTalkRecorder",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import logging
 import threading
 from dataclasses import dataclass, field
@@ -11,12 +12,79 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 ModelSize = Literal["tiny", "base", "small", "medium", "large-v3"]
+VADBackend = Literal["energy", "silero"]
 
 SAMPLE_RATE = 16000
-VAD_FRAME_MS = 30
-VAD_FRAME_SAMPLES = int(SAMPLE_RATE * VAD_FRAME_MS / 1000)
+# 512 samples (32 ms at 16 kHz): a power of two, so frames stay aligned for
+# the vectorised energy sums, and the frame size Silero VAD expects at 16 kHz.
+VAD_FRAME_SAMPLES = 512
+VAD_FRAME_MS = VAD_FRAME_SAMPLES * 1000 // SAMPLE_RATE
+# listen() reads this many VAD frames per stream.read() and scores them in one call
+VAD_BLOCK_FRAMES = 8
 ENERGY_THRESHOLD_DEFAULT = 0.01
+SILERO_THRESHOLD_DEFAULT = 0.5
+# Frames of earlier audio (about 1 s) scored again with each Silero block
+SILERO_CONTEXT_FRAMES = 32
 SILENCE_LIMIT_S = 1.5
+MAX_UTTERANCE_S = 30
+# Longest utterance transcribe_batch() packs into the batch: one Whisper window
+BATCH_CLIP_MAX_S = 30
+# Audio kept either side of the speech when transcribe_batch() trims a clip
+BATCH_TRIM_PAD_FRAMES = 6
+
+
+# Integer PCM normalisation factors for _prepare_audio, so the common
+# dtypes skip np.iinfo on every call
+_INT_SCALE = {
+    np.dtype(t): 1.0 / np.iinfo(t).max
+    for t in (np.int8, np.int16, np.int32, np.uint8, np.uint16)
+}
+
+
+# WhisperModels shared by every STTEngine in the process, keyed on their load
+# parameters. The app and the API server each own an engine; on CUDA a second
+# copy would mean a second context and another set of weights in VRAM.
+_shared_models: dict[tuple, object] = {}
+_shared_models_lock = threading.Lock()
+
+
+def _load_shared_model(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    num_workers: int,
+):
+    key = (model_size, device, compute_type, cpu_threads, num_workers)
+    with _shared_models_lock:
+        model = _shared_models.get(key)
+        if model is not None:
+            return model
+        from faster_whisper import WhisperModel
+
+        logger.info("Loading faster-whisper model: %s", model_size)
+        model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+        )
+        # One throwaway decode so the first real call doesn't pay for
+        # CTranslate2's lazy init. VAD is off so the silence is actually
+        # run through the encoder and decoder; the segments are lazy and
+        # must be consumed for that to happen.
+        segments, _ = model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            language="en",
+            beam_size=1,
+            vad_filter=False,
+        )
+        for _ in segments:
+            pass
+        _shared_models[key] = model
+        logger.info("Model loaded.")
+        return model
 
 
 @dataclass
@@ -33,11 +101,99 @@ class EnergyVAD:
     def __init__(self, threshold: float = ENERGY_THRESHOLD_DEFAULT):
         self.threshold = threshold
 
+    @property
+    def threshold(self) -> float:
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, value: float) -> None:
+        # rms > t  <=>  sum(x**2) > t**2 * n, so keep the squared forms around
+        # and skip the sqrt and mean per frame.
+        self._threshold = value
+        self._thr_sq_f32 = value * value
+        self._thr_sq_int = (value * 32768.0) ** 2
+
     def is_speech(self, audio: np.ndarray) -> bool:
-        if audio.size == 0:
+        n = audio.size
+        if n == 0:
             return False
-        rms = np.sqrt(np.mean(audio.astype(np.float32) ** 2))
-        return float(rms) > self.threshold
+        flat = audio.reshape(-1)
+        if flat.dtype == np.int16:
+            wide = flat.astype(np.int64)
+            return int(np.dot(wide, wide)) > self._thr_sq_int * n
+        if flat.dtype != np.float32 and flat.dtype != np.float64:
+            flat = flat.astype(np.float32)
+        return float(np.dot(flat, flat)) > self._thr_sq_f32 * n
+
+    def speech_mask(self, audio: np.ndarray, frame_samples: int = VAD_FRAME_SAMPLES) -> np.ndarray:
+        """Score consecutive *frame_samples*-long frames of mono *audio* at once.
+
+        Returns one bool per whole frame; a trailing partial frame is ignored.
+        """
+        n_frames = audio.shape[0] // frame_samples
+        frames = audio[:n_frames * frame_samples].reshape(n_frames, frame_samples)
+        if frames.dtype == np.int16:
+            wide = frames.astype(np.int64)
+            return np.einsum("ij,ij->i", wide, wide) > self._thr_sq_int * frame_samples
+        if frames.dtype != np.float32 and frames.dtype != np.float64:
+            frames = frames.astype(np.float32)
+        return np.einsum("ij,ij->i", frames, frames) > self._thr_sq_f32 * frame_samples
+
+    def reset(self) -> None:
+        """Energy detection is stateless; present for parity with SileroVAD."""
+
+
+class SileroVAD:
+    """Silero VAD, through the ONNX model faster-whisper bundles for its own filter.
+
+    Far fewer false positives on background noise than ``EnergyVAD``, so
+    ``listen()`` stops sooner and Whisper decodes less audio. faster-whisper's
+    runner (``faster_whisper.vad.get_vad_model()``, 1.1 and later) scores a
+    whole clip from fresh recurrent state on each call, so every block is
+    scored together with the ``SILERO_CONTEXT_FRAMES`` frames before it;
+    call ``reset()`` before a new utterance.
+    """
+
+    def __init__(self, threshold: float = SILERO_THRESHOLD_DEFAULT):
+        from faster_whisper.vad import get_vad_model
+
+        self._model = get_vad_model()
+        # 1.1's split encoder/decoder runner takes (batch, samples); 1.2 takes 1-D audio
+        self._batched_input = hasattr(self._model, "encoder_session")
+        self.threshold = threshold
+        self.reset()
+
+    def reset(self) -> None:
+        self._history = np.zeros(0, dtype=np.float32)
+
+    def _probs(self, frames: np.ndarray) -> np.ndarray:
+        """Speech probability of each VAD_FRAME_SAMPLES-long frame in *frames*."""
+        n_frames = frames.shape[0] // VAD_FRAME_SAMPLES
+        audio = np.concatenate([self._history, frames.astype(np.float32, copy=False)])
+        # Kept before the call: the runner zeroes part of its input in place
+        self._history = audio[-SILERO_CONTEXT_FRAMES * VAD_FRAME_SAMPLES:].copy()
+        out = self._model(audio[None] if self._batched_input else audio)
+        return np.asarray(out).reshape(-1)[-n_frames:]
+
+    def is_speech(self, audio: np.ndarray) -> bool:
+        return bool(self.speech_mask(audio.reshape(-1)).any())
+
+    def speech_mask(self, audio: np.ndarray, frame_samples: int = VAD_FRAME_SAMPLES) -> np.ndarray:
+        if frame_samples != VAD_FRAME_SAMPLES:
+            raise ValueError(f"Silero VAD scores {VAD_FRAME_SAMPLES}-sample frames")
+        n_frames = audio.shape[0] // frame_samples
+        if n_frames == 0:
+            return np.zeros(0, dtype=bool)
+        return self._probs(audio[:n_frames * frame_samples]) > self.threshold
+
+
+def _create_vad(backend: VADBackend, threshold: float) -> EnergyVAD | SileroVAD:
+    if backend == "silero":
+        try:
+            return SileroVAD()
+        except Exception as exc:
+            logger.warning("Silero VAD unavailable (%s); using energy VAD.", exc)
+    return EnergyVAD(threshold=threshold)
 
 
 class STTEngine:
@@ -46,6 +202,11 @@ class STTEngine:
         model_size: ModelSize = "base",
         device: str = "auto",
         compute_type: str = "auto",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        beam_size: int = 1,
+        condition_on_previous_text: bool = False,
+        vad_backend: VADBackend = "energy",
         vad_threshold: float = ENERGY_THRESHOLD_DEFAULT,
         silence_limit: float = SILENCE_LIMIT_S,
         on_partial: Callable[[str], None] | None = None,
@@ -54,13 +215,26 @@ class STTEngine:
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.beam_size = beam_size
+        self.condition_on_previous_text = condition_on_previous_text
         self.silence_limit = silence_limit
         self.on_partial = on_partial
         self.on_final = on_final
 
         self._model = None
+        # BatchedInferencePipeline over _model, built on first transcribe_batch();
+        # False when this faster-whisper doesn't have one.
+        self._batched = None
         self._model_lock = threading.Lock()
-        self._vad = EnergyVAD(threshold=vad_threshold)
+        # vad_threshold is the energy VAD's RMS threshold; Silero uses its own
+        # speech-probability cutoff.
+        self._vad = _create_vad(vad_backend, vad_threshold)
+        # transcribe_batch() trims with its own detector, so Silero's
+        # recurrent state isn't shared with a concurrent listen()
+        self._trim_vad = _create_vad(vad_backend, vad_threshold)
+        self._trim_lock = threading.Lock()
         self._listening = False
 
     def _ensure_model(self):
@@ -69,22 +243,41 @@ class STTEngine:
         with self._model_lock:
             if self._model is not None:
                 return
-            from faster_whisper import WhisperModel
-
-            logger.info("Loading faster-whisper model: %s", self.model_size)
-            self._model = WhisperModel(
+            self._model = _load_shared_model(
                 self.model_size,
-                device=self.device,
-                compute_type=self.compute_type,
+                self.device,
+                self.compute_type,
+                self.cpu_threads,
+                self.num_workers,
             )
-            logger.info("Model loaded.")
+
+    def preload(self) -> None:
+        """Load (and warm up) the Whisper model now rather than on first use."""
+        self._ensure_model()
 
     def transcribe(
         self,
         audio: np.ndarray | str | Path,
         language: str | None = None,
+        *,
+        beam_size: int | None = None,
+        high_quality: bool = False,
+        without_timestamps: bool = False,
     ) -> TranscriptionResult:
+        """Transcribe *audio*.
+
+        Decoding defaults to the engine's ``beam_size`` (greedy, 1, unless
+        configured otherwise); input is VAD-trimmed first, so beam search
+        rarely changes the result for short dictation. ``high_quality=True``
+        uses a 5-wide beam for batch work such as uploaded files.
+        ``without_timestamps=True`` skips timestamp decoding when only the
+        text is needed.
+        """
         self._ensure_model()
+        if high_quality:
+            beam_size = 5
+        elif beam_size is None:
+            beam_size = self.beam_size
 
         if isinstance(audio, (str, Path)):
             audio_input = str(audio)
@@ -94,8 +287,10 @@ class STTEngine:
         segments_iter, info = self._model.transcribe(
             audio_input,
             language=language,
-            beam_size=5,
+            beam_size=beam_size,
             vad_filter=True,
+            condition_on_previous_text=self.condition_on_previous_text,
+            without_timestamps=without_timestamps,
         )
 
         segments = []
@@ -120,24 +315,169 @@ class STTEngine:
             self.on_final(result)
         return result
 
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        language: str | None = None,
+        *,
+        batch_size: int = 8,
+    ) -> list[TranscriptionResult]:
+        """Transcribe several utterances in one batched decode.
+
+        The utterances are VAD-trimmed to their speech, laid end to end and
+        handed to faster-whisper's ``BatchedInferencePipeline`` as clip
+        timestamps, so up to *batch_size* of them go through the encoder and
+        decoder together. With *language* None, each utterance's language is
+        detected on its own and only utterances in the same language share a
+        batch. Utterances longer than one Whisper window, or every utterance
+        when faster-whisper has no batched pipeline, are transcribed one at a
+        time.
+        """
+        self._ensure_model()
+        prepared = [self._prepare_audio(a) for a in audios]
+        results: list[TranscriptionResult | None] = [None] * len(prepared)
+
+        limit = BATCH_CLIP_MAX_S * SAMPLE_RATE
+        long = [i for i, a in enumerate(prepared) if a.shape[0] > limit]
+        # (offset into the original audio, speech) for the clips to pack
+        trimmed: dict[int, tuple[int, np.ndarray]] = {}
+        for i, audio in enumerate(prepared):
+            if 0 < audio.shape[0] <= limit:
+                lead, speech = self._trim(audio)
+                if speech.size:
+                    trimmed[i] = (lead, speech)
+                else:
+                    results[i] = TranscriptionResult(text="")
+
+        batched = self._get_batched() if len(trimmed) > 1 else None
+        groups: dict[str | None, list[int]] = {}
+        if batched is None:
+            long.extend(trimmed)
+        elif language is not None:
+            groups[language] = list(trimmed)
+        else:
+            for i, (_, speech) in trimmed.items():
+                groups.setdefault(self._detect_language(speech), []).append(i)
+
+        for lang, packed in groups.items():
+            if lang is None or len(packed) == 1:
+                long.extend(packed)
+                continue
+            clips = []
+            starts = []
+            offset = 0
+            for i in packed:
+                n = trimmed[i][1].shape[0]
+                clips.append({"start": offset, "end": offset + n})
+                starts.append(offset / SAMPLE_RATE)
+                offset += n
+            joined = np.concatenate([trimmed[i][1] for i in packed])
+
+            segments_iter, info = batched.transcribe(
+                joined,
+                language=lang,
+                beam_size=self.beam_size,
+                batch_size=batch_size,
+                vad_filter=False,
+                clip_timestamps=clips,
+            )
+            per_clip: list[list] = [[] for _ in packed]
+            for seg in segments_iter:
+                k = max(bisect.bisect_right(starts, seg.start + 1e-3) - 1, 0)
+                per_clip[k].append(seg)
+
+            for k, i in enumerate(packed):
+                # Back to times in the caller's untrimmed audio
+                base = starts[k] - trimmed[i][0] / SAMPLE_RATE
+                segments = [
+                    {"start": seg.start - base, "end": seg.end - base, "text": seg.text}
+                    for seg in per_clip[k]
+                ]
+                result = TranscriptionResult(
+                    text=" ".join(seg.text.strip() for seg in per_clip[k]),
+                    language=info.language,
+                    language_probability=info.language_probability,
+                    segments=segments,
+                )
+                if self.on_partial:
+                    for seg in per_clip[k]:
+                        self.on_partial(seg.text.strip())
+                if self.on_final:
+                    self.on_final(result)
+                results[i] = result
+
+        for i in long:
+            audio = prepared[i]
+            results[i] = self.transcribe(audio, language) if audio.size else TranscriptionResult(text="")
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = TranscriptionResult(text="")
+        return results  # type: ignore[return-value]
+
+    def _trim(self, audio: np.ndarray) -> tuple[int, np.ndarray]:
+        """Cut *audio* down to its detected speech, plus a little padding.
+
+        Returns the sample offset of the kept part and the part itself, which
+        is empty when no frame is speech.
+        """
+        frame = VAD_FRAME_SAMPLES
+        with self._trim_lock:
+            self._trim_vad.reset()
+            speech = np.flatnonzero(self._trim_vad.speech_mask(audio, frame))
+        if speech.size == 0:
+            return 0, audio[:0]
+        start = max(int(speech[0]) - BATCH_TRIM_PAD_FRAMES, 0) * frame
+        end = min((int(speech[-1]) + 1 + BATCH_TRIM_PAD_FRAMES) * frame, audio.shape[0])
+        return start, audio[start:end]
+
+    def _detect_language(self, audio: np.ndarray) -> str | None:
+        """Language of one utterance, or None where faster-whisper can't tell us."""
+        detect = getattr(self._model, "detect_language", None)
+        if detect is None:
+            return None
+        try:
+            language, _, _ = detect(audio)
+        except Exception as exc:
+            logger.debug("Language detection failed: %s", exc)
+            return None
+        return language
+
+    def _get_batched(self):
+        if self._batched is None:
+            with self._model_lock:
+                if self._batched is None:
+                    try:
+                        from faster_whisper import BatchedInferencePipeline
+                    except ImportError:
+                        logger.info("faster-whisper has no BatchedInferencePipeline; batching disabled.")
+                        self._batched = False
+                    else:
+                        self._batched = BatchedInferencePipeline(model=self._model)
+        return self._batched or None
+
     def listen(
         self,
         language: str | None = None,
         sample_rate: int = SAMPLE_RATE,
+        max_seconds: float = MAX_UTTERANCE_S,
     ) -> TranscriptionResult:
-        """Record from microphone until silence, then transcribe."""
+        """Record from microphone until silence (or *max_seconds*), then transcribe."""
         import sounddevice as sd
 
         self._ensure_model()
         self._listening = True
 
-        chunk_samples = VAD_FRAME_SAMPLES
-        silence_chunks = int(self.silence_limit * sample_rate / chunk_samples)
+        frame = VAD_FRAME_SAMPLES
+        block = frame * VAD_BLOCK_FRAMES
+        silence_frames = int(self.silence_limit * sample_rate / frame)
 
-        audio_chunks: list[np.ndarray] = []
+        # Frames are written in place into one buffer; transcribe gets a view of it
+        buf = np.empty(int(max_seconds * sample_rate), dtype=np.float32)
+        pos = 0
         silent_count = 0
         speech_started = False
 
+        self._vad.reset()
         logger.info("Listening... speak now.")
 
         try:
@@ -145,42 +485,60 @@ class STTEngine:
                 samplerate=sample_rate,
                 channels=1,
                 dtype="float32",
-                blocksize=chunk_samples,
+                blocksize=block,
             ) as stream:
-                while self._listening:
-                    chunk, _ = stream.read(chunk_samples)
+                done = False
+                while self._listening and not done:
+                    chunk, _ = stream.read(block)
                     mono = chunk[:, 0] if chunk.ndim > 1 else chunk
 
-                    if self._vad.is_speech(mono):
-                        speech_started = True
-                        silent_count = 0
-                        audio_chunks.append(mono.copy())
-                    elif speech_started:
-                        silent_count += 1
-                        audio_chunks.append(mono.copy())
-                        if silent_count >= silence_chunks:
+                    # One vectorised energy pass per block; the loop below
+                    # only walks the resulting bools.
+                    for i, speech in enumerate(self._vad.speech_mask(mono, frame)):
+                        if speech:
+                            speech_started = True
+                            silent_count = 0
+                        elif speech_started:
+                            silent_count += 1
+                        else:
+                            continue
+
+                        end = pos + frame
+                        if end > buf.shape[0]:
+                            logger.info("Reached %.0f s utterance limit, stopping.", max_seconds)
+                            done = True
+                            break
+                        buf[pos:end] = mono[i * frame:(i + 1) * frame]
+                        pos = end
+                        if silent_count >= silence_frames:
+                            done = True
                             break
         except sd.PortAudioError as exc:
             raise RuntimeError(
                 "No audio input device available. Check your microphone."
             ) from exc
 
-        if not audio_chunks:
+        if pos == 0:
             return TranscriptionResult(text="")
 
-        audio = np.concatenate(audio_chunks)
-        return self.transcribe(audio, language=language)
+        return self.transcribe(buf[:pos], language=language)
 
     def stop_listening(self):
         self._listening = False
 
     @staticmethod
     def _prepare_audio(audio: np.ndarray) -> np.ndarray:
+        if audio.ndim == 1 and audio.dtype == np.float32:
+            return audio
+        scale = _INT_SCALE.get(audio.dtype)
+        if scale is None:
+            scale = 1.0 / np.iinfo(audio.dtype).max if np.issubdtype(audio.dtype, np.integer) else 1.0
+        out = np.empty(audio.shape[0], dtype=np.float32)
         if audio.ndim > 1:
-            audio = audio.mean(axis=1)
-        if audio.dtype != np.float32:
-            if np.issubdtype(audio.dtype, np.integer):
-                audio = audio.astype(np.float32) / np.iinfo(audio.dtype).max
-            else:
-                audio = audio.astype(np.float32)
-        return audio
+            # Downmix straight into the float32 output, then scale in place
+            np.sum(audio, axis=1, dtype=np.float32, out=out)
+            out *= np.float32(scale / audio.shape[1])
+        else:
+            # Convert and normalise in one pass
+            np.multiply(audio, np.float32(scale), out=out, dtype=np.float32)
+        return out
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
 import time
 from typing import Callable
@@ -11,6 +12,42 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_SAMPLE_RATE = 16000
 DEFAULT_CHANNELS = 1
+DEFAULT_POOL_SECONDS = 60
+DEFAULT_POOL_BUFFERS = 2
+
+
+class AudioBufferPool:
+    """Reusable mono float32 capture buffers, so each dictation doesn't allocate one.
+
+    ``acquire()`` falls back to a fresh buffer when the pool is empty, and
+    ``release()`` only keeps buffers of the pooled size, up to ``count`` of them.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        max_seconds: float = DEFAULT_POOL_SECONDS,
+        count: int = DEFAULT_POOL_BUFFERS,
+    ):
+        self.size = int(sample_rate * max_seconds)
+        self._count = count
+        self._free: queue.SimpleQueue[np.ndarray] = queue.SimpleQueue()
+        for _ in range(count):
+            self._free.put(np.empty(self.size, dtype=np.float32))
+
+    def acquire(self) -> np.ndarray:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            return np.empty(self.size, dtype=np.float32)
+
+    def release(self, audio: np.ndarray) -> None:
+        """Return a buffer, or a view into one, to the pool."""
+        buf = audio if audio.base is None else audio.base
+        if not isinstance(buf, np.ndarray) or buf.shape != (self.size,) or buf.dtype != np.float32:
+            return
+        if self._free.qsize() < self._count:
+            self._free.put(buf)
 
 
 class AudioRecorder:
@@ -21,14 +58,26 @@ class AudioRecorder:
         dtype: str = "float32",
         device: int | str | None = None,
         on_audio: Callable[[np.ndarray], None] | None = None,
+        buffer_pool: AudioBufferPool | None = None,
+        max_seconds: float = DEFAULT_POOL_SECONDS,
     ):
         self.sample_rate = sample_rate
         self.channels = channels
         self.dtype = dtype
         self.device = device
         self.on_audio = on_audio
+        # Mono float32 capture is written straight into one contiguous buffer:
+        # a pooled one if a pool is given, else the recorder's own reusable
+        # one. Anything else, or a recording that outgrows the buffer, uses
+        # the chunk list.
+        mono_f32 = channels == 1 and dtype == "float32"
+        self._pool = buffer_pool if mono_f32 else None
+        self._own_size = int(sample_rate * max_seconds) if mono_f32 and buffer_pool is None else 0
+        self._own_buf: np.ndarray | None = None
 
         self._chunks: list[np.ndarray] = []
+        self._buf: np.ndarray | None = None
+        self._n = 0
         self._lock = threading.Lock()
         self._stream = None
         self._recording = False
@@ -44,6 +93,8 @@ class AudioRecorder:
         import sounddevice as sd
 
         self._chunks.clear()
+        self._buf = self._acquire_buffer()
+        self._n = 0
         self._recording = True
 
         try:
@@ -72,15 +123,40 @@ class AudioRecorder:
             self._stream.close()
             self._stream = None
 
+        # Only swap state under the lock; the concatenate runs outside it so
+        # a late callback is never stuck behind a long copy.
         with self._lock:
-            if not self._chunks:
-                return np.array([], dtype=np.float32)
-            audio = np.concatenate(self._chunks)
-            self._chunks.clear()
+            buf, n = self._buf, self._n
+            self._buf = None
+            chunks, self._chunks = self._chunks, []
+
+        if buf is not None and buf is self._own_buf:
+            # The recorder's own buffer is reused by the next start(), so the
+            # caller gets the one copy it can keep.
+            audio = buf[:n].copy()
+        elif buf is not None:
+            # A view into the pooled buffer; the caller hands it back with
+            # AudioBufferPool.release() once it is done with the samples.
+            audio = buf[:n]
+        elif not chunks:
+            return np.array([], dtype=np.float32)
+        else:
+            total = sum(c.shape[0] for c in chunks)
+            audio = np.empty((total,) + chunks[0].shape[1:], dtype=chunks[0].dtype)
+            np.concatenate(chunks, out=audio)
 
         logger.info("Recording stopped. Captured %.2f seconds.", len(audio) / self.sample_rate)
         return audio
 
+    def _acquire_buffer(self) -> np.ndarray | None:
+        if self._pool is not None:
+            return self._pool.acquire()
+        if self._own_size:
+            if self._own_buf is None:
+                self._own_buf = np.empty(self._own_size, dtype=np.float32)
+            return self._own_buf
+        return None
+
     def record(self, duration: float) -> np.ndarray:
         self.start()
         time.sleep(duration)
@@ -89,11 +165,27 @@ class AudioRecorder:
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         if status:
             logger.warning("Audio callback status: %s", status)
-        chunk = indata.copy()
         with self._lock:
-            self._chunks.append(chunk)
+            buf = self._buf
+            if buf is not None:
+                end = self._n + frames
+                if end <= buf.shape[0]:
+                    buf[self._n:end] = indata[:, 0]
+                    self._n = end
+                    chunk = None
+                else:
+                    # Outgrew the buffer: spill what we have into the
+                    # chunk list and carry on without it.
+                    self._chunks.append(buf[:self._n].reshape(-1, 1).copy())
+                    if self._pool is not None:
+                        self._pool.release(buf)
+                    self._buf = None
+                    buf = None
+            if buf is None:
+                chunk = indata.copy()
+                self._chunks.append(chunk)
         if self.on_audio:
-            self.on_audio(chunk)
+            self.on_audio(indata.copy() if chunk is None else chunk)
 
 
 class PushToTalkRecorder:
@@ -111,6 +203,11 @@ class PushToTalkRecorder:
         self._recorder = AudioRecorder(sample_rate=sample_rate, channels=channels)
         self._running = False
         self._thread: threading.Thread | None = None
+        # Set from the keyboard hook thread; the key's auto-repeat presses are
+        # collapsed by _held so each hold is one press/release pair.
+        self._held = False
+        self._pressed = threading.Event()
+        self._released = threading.Event()
 
     def run(self) -> None:
         """Blocking loop: hold key to record, release to process. Press Esc to quit."""
@@ -123,22 +220,46 @@ class PushToTalkRecorder:
             )
 
         self._running = True
+        self._held = False
+        self._pressed.clear()
+        self._released.clear()
+        # Edge-triggered hooks: the loop sleeps on the events between
+        # utterances instead of keyboard.wait()/is_pressed() polling.
+        press_hook = keyboard.on_press_key(self.key, self._on_key_down)
+        release_hook = keyboard.on_release_key(self.key, self._on_key_up, suppress=True)
+        esc_hotkey = keyboard.add_hotkey("esc", self.stop)
         logger.info("Push-to-talk ready. Hold '%s' to record, Esc to quit.", self.key)
 
-        while self._running:
-            keyboard.wait(self.key)
-            if not self._running:
-                break
+        try:
+            while self._running:
+                self._pressed.wait()
+                self._pressed.clear()
+                if not self._running:
+                    break
+
+                self._recorder.start()
+                self._released.wait()
+                self._released.clear()
 
-            self._recorder.start()
-            keyboard.wait(self.key, suppress=True, trigger_on_release=True)
+                audio = self._recorder.stop()
+                if audio.size > 0 and self.on_release:
+                    self.on_release(audio)
+        finally:
+            keyboard.unhook(press_hook)
+            keyboard.unhook(release_hook)
+            keyboard.remove_hotkey(esc_hotkey)
+            if self._recorder.is_recording:
+                self._recorder.stop()
 
-            audio = self._recorder.stop()
-            if audio.size > 0 and self.on_release:
-                self.on_release(audio)
+    def _on_key_down(self, _event) -> None:
+        if not self._held:
+            self._held = True
+            self._pressed.set()
 
-            if keyboard.is_pressed("esc"):
-                break
+    def _on_key_up(self, _event) -> None:
+        if self._held:
+            self._held = False
+            self._released.set()
 
     def run_background(self) -> None:
         self._thread = threading.Thread(target=self.run, daemon=True)
@@ -146,6 +267,9 @@ class PushToTalkRecorder:
 
     def stop(self) -> None:
         self._running = False
+        # Wake the loop wherever it is waiting
+        self._pressed.set()
+        self._released.set()
 
     @staticmethod
     def list_devices() -> str:
@@ -1,22 +1,66 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import io
+import json
 import logging
+import queue
+import shutil
 import subprocess
 import threading
 import wave
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum, auto
 from pathlib import Path
-from typing import Callable, Optional
-
-import numpy as np
+from typing import Callable, Iterable, Iterator, Optional
 
 from orion_voice.tts.voices import PiperVoiceManager
 
 logger = logging.getLogger(__name__)
 
+_FFMPEG_DECODE_ARGS = (
+    "-hide_banner", "-loglevel", "error",
+    "-i", "pipe:0", "-f", "s16le", "-ar", "24000", "-ac", "1", "pipe:1",
+)
+
+
+# 100 ms of 24 kHz s16le mono per read from the streaming decoder
+_EDGE_STREAM_BLOCK = 24000 // 10 * 2
+
+# Streamed playback waits for this much PCM before the first write, and lets
+# synthesis run at most this many chunks ahead of the output device
+_PREBUFFER_MS = 150
+_PREFETCH_CHUNKS = 16
+
+
+@functools.lru_cache(maxsize=None)
+def _has_piper_module() -> bool:
+    try:
+        import piper.voice  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _piper_sample_rate(model_path: Path) -> int:
+    """Output rate from the model's ``.onnx.json``, as both piper-tts and the CLI use."""
+    try:
+        config = json.loads(model_path.with_name(model_path.name + ".json").read_bytes())
+        return int(config["audio"]["sample_rate"])
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("No sample rate in config for %s, assuming 22050 Hz: %s", model_path.name, exc)
+        return 22050
+
+
+@functools.lru_cache(maxsize=None)
+def _find_ffmpeg() -> Optional[str]:
+    return shutil.which("ffmpeg")
+
 
 class PlaybackState(Enum):
     IDLE = auto()
@@ -30,6 +74,13 @@ class TTSEngine(ABC):
     def synthesize(self, text: str) -> bytes:
         """Return raw PCM/WAV audio bytes for the given text."""
 
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """Yield raw PCM for *text* in pieces as it becomes available.
+
+        The default synthesises everything up front and yields it once.
+        """
+        yield self.synthesize(text)
+
     @abstractmethod
     def set_voice(self, name: str) -> None: ...
 
@@ -51,10 +102,15 @@ class PiperEngine(TTSEngine):
         self._voice: Optional[str] = None
         self._speed: float = 1.0
         self._piper_exe: Optional[Path] = self._find_piper()
+        # In-process voice from the piper-tts package, loaded once per model
+        # instead of the CLI reloading the ONNX model on every utterance
+        self._loaded: Optional[tuple[Path, object]] = None
+        self._load_lock = threading.Lock()
+        # Resolved model path, so synthesize() doesn't rescan the models dir
+        self._model_path: Optional[Path] = None
+        self._cache = _PCMCache()
 
     def _find_piper(self) -> Optional[Path]:
-        import shutil
-
         exe = shutil.which("piper") or shutil.which("piper.exe")
         if exe:
             return Path(exe)
@@ -63,7 +119,7 @@ class PiperEngine(TTSEngine):
 
     @property
     def available(self) -> bool:
-        if self._piper_exe is None:
+        if self._piper_exe is None and not _has_piper_module():
             return False
         if self._voice:
             return self._manager.get_model_path(self._voice) is not None
@@ -71,18 +127,29 @@ class PiperEngine(TTSEngine):
 
     @property
     def sample_rate(self) -> int:
-        return 22050
+        # Read from the resolved model itself, so it holds after a cache hit
+        # or a CLI fallback where no voice was ever loaded
+        model_path = self._model_path
+        if model_path is None:
+            return 22050
+        return _piper_sample_rate(model_path)
 
     def set_voice(self, name: str) -> None:
         path = self._manager.get_model_path(name)
         if path is None:
             raise FileNotFoundError(f"Piper voice model not found: {name}")
         self._voice = name
+        self._model_path = path
 
     def set_speed(self, speed: float) -> None:
         self._speed = max(0.5, min(2.0, speed))
 
     def _resolve_model(self) -> Path:
+        if self._model_path is None:
+            self._model_path = self._find_model()
+        return self._model_path
+
+    def _find_model(self) -> Path:
         if self._voice:
             path = self._manager.get_model_path(self._voice)
             if path:
@@ -92,12 +159,131 @@ class PiperEngine(TTSEngine):
             raise RuntimeError("No Piper voice models installed")
         return self._manager.get_model_path(installed[0])  # type: ignore[return-value]
 
-    def synthesize(self, text: str) -> bytes:
-        if not self._piper_exe:
-            raise RuntimeError("Piper executable not found")
+    def _get_voice(self, model_path: Path) -> object:
+        loaded = self._loaded
+        if loaded is not None and loaded[0] == model_path:
+            return loaded[1]
+        with self._load_lock:
+            loaded = self._loaded
+            if loaded is not None and loaded[0] == model_path:
+                return loaded[1]
+            from piper.voice import PiperVoice
+
+            logger.info("Loading Piper voice: %s", model_path.name)
+            voice = PiperVoice.load(str(model_path))
+            self._loaded = (model_path, voice)
+            return voice
+
+    def preload(self) -> None:
+        """Resolve the voice model and load it in-process, without synthesising."""
+        model_path = self._resolve_model()
+        if _has_piper_module():
+            self._get_voice(model_path)
 
+    def synthesize(self, text: str) -> bytes:
+        model_path = self._resolve_model()
+        key = _PCMCache.key(str(model_path), self._speed, text)
+        pcm = self._cache.get(key)
+        if pcm is None:
+            pcm = self._synthesize_uncached(model_path, text)
+            self._cache.put(key, pcm)
+        return pcm
+
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """Yield PCM sentence by sentence in-process, or as the CLI writes it.
+
+        The model is resolved before this returns, so ``sample_rate`` is
+        already correct for the stream.
+        """
         model_path = self._resolve_model()
+        key = _PCMCache.key(str(model_path), self._speed, text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return iter((cached,))
+        in_process = False
+        if _has_piper_module():
+            try:
+                self._get_voice(model_path)
+                in_process = True
+            except Exception as exc:
+                if not self._piper_exe:
+                    raise
+                logger.warning("In-process Piper unavailable, using the CLI: %s", exc)
+        return self._stream_uncached(model_path, text, key, in_process)
+
+    def _stream_uncached(
+        self, model_path: Path, text: str, key: tuple, in_process: bool
+    ) -> Iterator[bytes]:
         length_scale = 1.0 / self._speed
+        parts: list[bytes] = []
+        if in_process:
+            try:
+                for chunk in _piper_pcm(self._get_voice(model_path), text, length_scale):
+                    parts.append(chunk)
+                    yield chunk
+            except Exception as exc:
+                # Nothing played yet, so the CLI can still take over cleanly
+                if parts or not self._piper_exe:
+                    raise
+                logger.warning("In-process Piper failed, using the CLI: %s", exc)
+                in_process = False
+        if not in_process:
+            if not self._piper_exe:
+                raise RuntimeError("Piper executable not found")
+            proc = subprocess.Popen(
+                [
+                    str(self._piper_exe),
+                    "--model", str(model_path),
+                    "--length-scale", str(length_scale),
+                    "--output-raw",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+
+            def _feed() -> None:
+                try:
+                    proc.stdin.write(text.encode("utf-8"))
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+            # Fed from a thread so a long text can't deadlock against a full stdout pipe
+            threading.Thread(target=_feed, daemon=True).start()
+            block = self.sample_rate // 10 * 2
+            try:
+                while True:
+                    chunk = proc.stdout.read(block)
+                    if not chunk:
+                        break
+                    parts.append(chunk)
+                    yield chunk
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                proc.stdout.close()
+                stderr = proc.stderr.read()
+                proc.stderr.close()
+                proc.wait()
+            if proc.returncode != 0:
+                raise RuntimeError(f"Piper failed: {stderr.decode(errors='replace')}")
+        self._cache.put(key, b"".join(parts))
+
+    def _synthesize_uncached(self, model_path: Path, text: str) -> bytes:
+        length_scale = 1.0 / self._speed
+
+        if _has_piper_module():
+            try:
+                voice = self._get_voice(model_path)
+                return b"".join(_piper_pcm(voice, text, length_scale))
+            except Exception as exc:
+                if not self._piper_exe:
+                    raise
+                logger.warning("In-process Piper failed, using the CLI: %s", exc)
+
+        if not self._piper_exe:
+            raise RuntimeError("Piper executable not found")
 
         proc = subprocess.run(
             [
@@ -115,12 +301,36 @@ class PiperEngine(TTSEngine):
         return proc.stdout
 
 
+def _piper_pcm(voice: object, text: str, length_scale: float) -> Iterator[bytes]:
+    """Raw s16le PCM from an in-process PiperVoice, on either piper-tts API.
+
+    piper-tts 1.2 has ``synthesize_stream_raw``; 1.3 and later replaced it
+    with ``synthesize()`` yielding AudioChunk objects.
+    """
+    stream_raw = getattr(voice, "synthesize_stream_raw", None)
+    if stream_raw is not None:
+        yield from stream_raw(text, length_scale=length_scale)
+        return
+    from piper import SynthesisConfig
+
+    config = SynthesisConfig(length_scale=length_scale)
+    for chunk in voice.synthesize(text, syn_config=config):  # type: ignore[attr-defined]
+        yield chunk.audio_int16_bytes
+
+
 class EdgeEngine(TTSEngine):
     DEFAULT_VOICE = "en-US-AriaNeural"
 
     def __init__(self) -> None:
         self._voice: str = self.DEFAULT_VOICE
         self._speed: float = 1.0
+        # edge-tts is asyncio-only; run it on one long-lived loop thread
+        # (started on first use) rather than a new thread + loop per call.
+        # Kept separate from FastAPI's loop on purpose.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._cache = _PCMCache()
 
     @property
     def available(self) -> bool:
@@ -144,7 +354,36 @@ class EdgeEngine(TTSEngine):
         pct = int((self._speed - 1.0) * 100)
         return f"{pct:+d}%"
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=loop.run_forever, name="edge-tts-loop", daemon=True
+                )
+                self._loop_thread.start()
+                self._loop = loop
+            return self._loop
+
+    def close(self) -> None:
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            loop.close()
+
     def synthesize(self, text: str) -> bytes:
+        key = _PCMCache.key(self._voice, self._speed, text)
+        pcm = self._cache.get(key)
+        if pcm is None:
+            pcm = self._synthesize_uncached(text)
+            self._cache.put(key, pcm)
+        return pcm
+
+    def _synthesize_uncached(self, text: str) -> bytes:
         import edge_tts
 
         async def _run() -> bytes:
@@ -155,28 +394,114 @@ class EdgeEngine(TTSEngine):
                     buf.write(chunk["data"])
             return buf.getvalue()
 
-        # Always use a new event loop in a separate thread to avoid
-        # conflicts with FastAPI's running loop
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            mp3_bytes = pool.submit(lambda: asyncio.run(_run())).result(timeout=30)
+        fut = asyncio.run_coroutine_threadsafe(_run(), self._get_loop())
+        try:
+            mp3_bytes = fut.result(timeout=30)
+        except concurrent.futures.TimeoutError:
+            # Not the builtin TimeoutError before Python 3.11
+            fut.cancel()
+            raise
 
         return self._decode_mp3(mp3_bytes)
 
+    def synthesize_stream(self, text: str) -> Iterator[bytes]:
+        """Yield PCM while the MP3 is still downloading, decoded by one ffmpeg pipe."""
+        key = _PCMCache.key(self._voice, self._speed, text)
+        cached = self._cache.get(key)
+        ffmpeg = _find_ffmpeg()
+        if cached is not None or not ffmpeg:
+            yield cached if cached is not None else self.synthesize(text)
+            return
+
+        import edge_tts
+
+        proc = subprocess.Popen(
+            [ffmpeg, *_FFMPEG_DECODE_ARGS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+        def _write(data: bytes) -> None:
+            proc.stdin.write(data)
+            proc.stdin.flush()
+
+        async def _run() -> None:
+            try:
+                comm = edge_tts.Communicate(text, self._voice, rate=self._speed_str())
+                async for chunk in comm.stream():
+                    if chunk["type"] == "audio":
+                        # The pipe can block while playback is paused; keep
+                        # that off the shared loop
+                        await asyncio.to_thread(_write, chunk["data"])
+            finally:
+                try:
+                    proc.stdin.close()
+                except OSError:
+                    pass
+
+        fut = asyncio.run_coroutine_threadsafe(_run(), self._get_loop())
+        blocks: list[bytes] = []
+        try:
+            while True:
+                block = proc.stdout.read(_EDGE_STREAM_BLOCK)
+                if not block:
+                    break
+                blocks.append(block)
+                yield block
+        except BaseException:
+            # Closed early by the player, or failed: stop the download too
+            fut.cancel()
+            raise
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+        try:
+            fut.result(timeout=5)
+        except BrokenPipeError:
+            # ffmpeg stopped reading before the MP3 ended, so the PCM is cut short
+            complete = False
+        except Exception as exc:
+            raise RuntimeError(f"Edge TTS failed: {exc}") from exc
+        else:
+            complete = True
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed to decode Edge TTS audio (exit {proc.returncode})")
+        # Only a stream that downloaded and decoded completely is worth replaying
+        if complete:
+            self._cache.put(key, b"".join(blocks))
+
     @staticmethod
     def _decode_mp3(data: bytes) -> bytes:
-        # Try av (PyAV) first - already installed via faster-whisper
+        # ffmpeg decodes the whole clip in one native pass, so prefer it
+        ffmpeg = _find_ffmpeg()
+        if ffmpeg:
+            proc = subprocess.run(
+                [ffmpeg, *_FFMPEG_DECODE_ARGS],
+                input=data,
+                capture_output=True,
+                timeout=15,
+            )
+            if proc.returncode == 0:
+                return proc.stdout
+            logger.warning("ffmpeg MP3 decode failed: %s", proc.stderr.decode(errors="replace"))
+
+        # PyAV (already installed via faster-whisper): collect the resampled
+        # frames in an AudioFifo and convert once at the end
         try:
             import av
-            container = av.open(io.BytesIO(data), format="mp3")
-            resampler = av.AudioResampler(format="s16", layout="mono", rate=24000)
-            pcm_chunks = []
-            for frame in container.decode(audio=0):
-                resampled = resampler.resample(frame)
-                for r in resampled:
-                    pcm_chunks.append(r.to_ndarray().tobytes())
-            container.close()
-            return b"".join(pcm_chunks)
+            with av.open(io.BytesIO(data), format="mp3") as container:
+                resampler = av.AudioResampler(format="s16", layout="mono", rate=24000)
+                fifo = av.AudioFifo()
+                for frame in container.decode(audio=0):
+                    for r in resampler.resample(frame):
+                        fifo.write(r)
+                for r in resampler.resample(None):
+                    fifo.write(r)
+            out = fifo.read()
+            return out.to_ndarray().tobytes() if out is not None else b""
         except Exception:
             pass
 
@@ -189,19 +514,140 @@ class EdgeEngine(TTSEngine):
         except ImportError:
             pass
 
-        # Try ffmpeg
-        proc = subprocess.run(
-            ["ffmpeg", "-i", "pipe:0", "-f", "s16le", "-ar", "24000", "-ac", "1", "pipe:1"],
-            input=data,
-            capture_output=True,
-            timeout=15,
-        )
-        if proc.returncode != 0:
-            raise RuntimeError(
-                "Cannot decode MP3. Install pydub or ffmpeg. "
-                f"ffmpeg stderr: {proc.stderr.decode(errors='replace')}"
-            )
-        return proc.stdout
+        raise RuntimeError("Cannot decode MP3. Install ffmpeg, PyAV or pydub.")
+
+
+class _PCMCache:
+    """Small LRU of synthesised PCM so repeated phrases skip synthesis entirely."""
+
+    def __init__(self, max_entries: int = 64, max_bytes: int = 16 << 20) -> None:
+        self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+        self._bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(voice: str, speed: float, text: str) -> tuple:
+        return (voice, speed, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+
+    def get(self, key: tuple) -> Optional[bytes]:
+        with self._lock:
+            pcm = self._entries.get(key)
+            if pcm is not None:
+                self._entries.move_to_end(key)
+            return pcm
+
+    def put(self, key: tuple, pcm: bytes) -> None:
+        if not pcm or len(pcm) > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = pcm
+            self._bytes += len(pcm)
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+
+def _rechunk(chunks: Iterable[bytes], size: int) -> Iterator[memoryview]:
+    """Slice each PCM chunk into views of at most *size* bytes."""
+    for chunk in chunks:
+        view = memoryview(chunk)
+        for i in range(0, len(view), size):
+            yield view[i : i + size]
+
+
+_END = object()
+
+
+def _prefetch(
+    chunks: Iterable[bytes],
+    prebuffer_bytes: int,
+    stop: threading.Event,
+    max_chunks: int = _PREFETCH_CHUNKS,
+) -> Iterator[bytes]:
+    """Pull *chunks* on a producer thread into a bounded queue, so synthesis
+    of the next piece overlaps playback of the current one.
+
+    Nothing is yielded until *prebuffer_bytes* have arrived (or the stream
+    ended). The stream also ends once *stop* is set, even while the producer
+    is still working on the next piece. Closing the returned iterator stops
+    the producer, which then closes *chunks* on its own thread.
+    """
+    q: queue.Queue = queue.Queue(maxsize=max_chunks)
+    done = threading.Event()
+
+    def _put(item: object) -> bool:
+        while not done.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _produce() -> None:
+        end: object = _END
+        try:
+            for chunk in chunks:
+                if not _put(chunk):
+                    return
+        except Exception as exc:
+            end = exc
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        _put(end)
+
+    def _get() -> object:
+        while True:
+            try:
+                item = q.get(timeout=0.1)
+                break
+            except queue.Empty:
+                if stop.is_set():
+                    return _END
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    threading.Thread(target=_produce, daemon=True, name="tts-prefetch").start()
+    try:
+        pending: list[bytes] = []
+        size = 0
+        item = None
+        while size < prebuffer_bytes:
+            item = _get()
+            if item is _END:
+                break
+            pending.append(item)  # type: ignore[arg-type]
+            size += len(item)  # type: ignore[arg-type]
+        yield from pending
+        if item is _END:
+            return
+        while True:
+            item = _get()
+            if item is _END:
+                return
+            yield item  # type: ignore[misc]
+    finally:
+        done.set()
+
+
+def _prepend(first: Optional[bytes], rest: Iterator[bytes]) -> Iterator[bytes]:
+    """*first* (if any) then *rest*; closing this also closes *rest*."""
+    try:
+        if first is not None:
+            yield first
+        yield from rest
+    finally:
+        close = getattr(rest, "close", None)
+        if close is not None:
+            close()
 
 
 class _AudioPlayer:
@@ -212,6 +658,8 @@ class _AudioPlayer:
         self._lock = threading.Lock()
         self._pause_event = threading.Event()
         self._pause_event.set()
+        # Each playback gets its own stop event, so one that outlives stop()'s
+        # join can never mistake a later playback's cleared event for its own
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
@@ -220,79 +668,133 @@ class _AudioPlayer:
         return self._state
 
     def play(self, pcm_data: bytes, sample_rate: int, on_done: Optional[Callable[[], None]] = None) -> None:
+        self._start(self._playback_loop, (pcm_data, sample_rate, on_done))
+
+    def play_stream(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int,
+        on_done: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Play s16le PCM as it is produced by *chunks*, e.g. a synthesize_stream()."""
+        self._start(self._stream_loop, (chunks, sample_rate, on_done))
+
+    def _start(self, target: Callable[..., None], args: tuple) -> None:
         self.stop()
-        self._stop_event.clear()
-        self._pause_event.set()
-        self._state = PlaybackState.PLAYING
-        self._thread = threading.Thread(
-            target=self._playback_loop,
-            args=(pcm_data, sample_rate, on_done),
-            daemon=True,
-        )
+        stop = threading.Event()
+        with self._lock:
+            self._stop_event = stop
+            self._pause_event.set()
+            self._state = PlaybackState.PLAYING
+        self._thread = threading.Thread(target=target, args=(*args, stop), daemon=True)
         self._thread.start()
 
-    def _playback_loop(self, pcm_data: bytes, sample_rate: int, on_done: Optional[Callable[[], None]]) -> None:
+    def _finish(self, on_done: Optional[Callable[[], None]], stop: threading.Event) -> None:
+        with self._lock:
+            # A playback that was already replaced leaves the state alone
+            if stop is self._stop_event and self._state != PlaybackState.STOPPED:
+                self._state = PlaybackState.IDLE
+        if on_done:
+            on_done()
+
+    def _playback_loop(
+        self,
+        pcm_data: bytes,
+        sample_rate: int,
+        on_done: Optional[Callable[[], None]],
+        stop: threading.Event,
+    ) -> None:
         try:
-            self._play_with_sounddevice(pcm_data, sample_rate)
+            self._play_with_sounddevice(pcm_data, sample_rate, stop)
         except Exception:
             try:
-                self._play_with_pygame(pcm_data, sample_rate)
+                self._play_with_pygame(pcm_data, sample_rate, stop)
             except Exception as exc:
                 logger.error("No audio backend available: %s", exc)
         finally:
-            with self._lock:
-                if self._state != PlaybackState.STOPPED:
-                    self._state = PlaybackState.IDLE
-            if on_done:
-                on_done()
+            self._finish(on_done, stop)
 
-    def _play_with_sounddevice(self, pcm_data: bytes, sample_rate: int) -> None:
-        import sounddevice as sd
+    def _stream_loop(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int,
+        on_done: Optional[Callable[[], None]],
+        stop: threading.Event,
+    ) -> None:
+        chunks = _prefetch(chunks, sample_rate * 2 * _PREBUFFER_MS // 1000, stop)
+        try:
+            try:
+                stream = self._open_output(sample_rate)
+            except Exception:
+                # pygame can't stream, so it waits for the whole clip
+                self._play_with_pygame(b"".join(chunks), sample_rate, stop)
+                return
+            bytes_per_block = (sample_rate // 50) * 2
+            self._write_blocks(stream, _rechunk(chunks, bytes_per_block), stop)
+        except Exception as exc:
+            logger.error("Streaming playback failed: %s", exc)
+        finally:
+            # Stop the producer (and any decoder it owns) if we bailed early
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            self._finish(on_done, stop)
 
-        samples = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
-        chunk_size = sample_rate // 10  # 100ms chunks
-        finished = threading.Event()
+    @staticmethod
+    def _open_output(sample_rate: int):
+        import sounddevice as sd
 
-        stream = sd.OutputStream(
+        # s16le goes to PortAudio as-is in 20 ms blocks; no float conversion,
+        # and short enough for pause/stop to take effect quickly.
+        stream = sd.RawOutputStream(
             samplerate=sample_rate,
             channels=1,
-            dtype="float32",
-            blocksize=chunk_size,
+            dtype="int16",
+            blocksize=sample_rate // 50,
         )
         stream.start()
+        return stream
+
+    def _write_blocks(self, stream, blocks: Iterable[bytes | memoryview], stop: threading.Event) -> None:
         try:
-            for i in range(0, len(samples), chunk_size):
+            for block in blocks:
                 self._pause_event.wait()
-                if self._stop_event.is_set():
+                if stop.is_set():
                     return
-                chunk = samples[i : i + chunk_size]
-                stream.write(chunk.reshape(-1, 1))
+                stream.write(block)
         finally:
-            stream.stop()
+            # stop() drains what PortAudio has queued; on a user stop throw it
+            # away instead so playback halts immediately
+            if stop.is_set():
+                stream.abort()
+            else:
+                stream.stop()
             stream.close()
 
-    def _play_with_pygame(self, pcm_data: bytes, sample_rate: int) -> None:
+    def _play_with_sounddevice(self, pcm_data: bytes, sample_rate: int, stop: threading.Event) -> None:
+        stream = self._open_output(sample_rate)
+        self._write_blocks(stream, _rechunk((pcm_data,), (sample_rate // 50) * 2), stop)
+
+    def _play_with_pygame(self, pcm_data: bytes, sample_rate: int, stop: threading.Event) -> None:
         import pygame
 
-        if not pygame.mixer.get_init():
-            pygame.mixer.init(frequency=sample_rate, size=-16, channels=1)
+        if stop.is_set():
+            return
 
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(pcm_data)
-        buf.seek(0)
+        # Raw samples are handed to the mixer as-is, so it has to be running
+        # at exactly this rate and format (Piper and Edge differ in rate)
+        if pygame.mixer.get_init() != (sample_rate, -16, 1):
+            pygame.mixer.quit()
+            pygame.mixer.init(frequency=sample_rate, size=-16, channels=1)
 
-        sound = pygame.mixer.Sound(buf)
+        sound = pygame.mixer.Sound(buffer=pcm_data)
         channel = sound.play()
         if channel is None:
             return
 
         while channel.get_busy():
             self._pause_event.wait()
-            if self._stop_event.is_set():
+            if stop.is_set():
                 channel.stop()
                 return
             pygame.time.wait(50)
@@ -357,13 +859,25 @@ class TTSManager:
         if not text.strip():
             return
 
-        pcm, sr = self._synthesize(text)
-        if blocking:
-            self._player.play(pcm, sr, on_done)
-            if self._player._thread:
-                self._player._thread.join()
+        engine = next((e for e in self._engine_order() if e.available), None)
+        chunks: Optional[Iterator[bytes]] = None
+        if engine is not None:
+            # Start playback on the first synthesized/decoded block instead of
+            # after the whole clip is ready. Streams fail lazily, so pull the
+            # first block here, where the other engine can still take over.
+            try:
+                stream = engine.synthesize_stream(text)
+                first = next(stream, None)
+                chunks = _prepend(first, stream)
+            except Exception as exc:
+                logger.warning("Engine %s failed: %s", type(engine).__name__, exc)
+        if chunks is not None:
+            self._player.play_stream(chunks, engine.sample_rate, on_done)  # type: ignore[union-attr]
         else:
+            pcm, sr = self._synthesize(text, skip=engine)
             self._player.play(pcm, sr, on_done)
+        if blocking and self._player._thread:
+            self._player._thread.join()
 
     def synthesize_to_file(self, text: str, path: Path) -> None:
         pcm, sr = self._synthesize(text)
@@ -373,8 +887,8 @@ class TTSManager:
             wf.setframerate(sr)
             wf.writeframes(pcm)
 
-    def _synthesize(self, text: str) -> tuple[bytes, int]:
-        engines = self._engine_order()
+    def _synthesize(self, text: str, skip: Optional[TTSEngine] = None) -> tuple[bytes, int]:
+        engines = [e for e in self._engine_order() if e is not skip]
         last_err: Optional[Exception] = None
         for engine in engines:
             try:
@@ -390,6 +904,14 @@ class TTSManager:
             return [self.edge, self.piper]
         return [self.piper, self.edge]
 
+    def preload(self) -> None:
+        """Load the Piper voice ahead of the first speak() when Piper goes first.
+
+        Edge has nothing local to load, so an Edge-first setup does no work here.
+        """
+        if self._engine_order()[0] is self.piper and self.piper.available:
+            self.piper.preload()
+
     def pause(self) -> None:
         self._player.pause()
 
@@ -398,3 +920,8 @@ class TTSManager:
 
     def stop(self) -> None:
         self._player.stop()
+
+    def close(self) -> None:
+        """Stop playback and shut down the Edge engine's event loop thread."""
+        self._player.stop()
+        self.edge.close()
@@ -1,12 +1,32 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import base64
+import concurrent.futures
+import gzip
+import http.client
 import logging
+import os
+import re
 import shutil
+import socket
+import threading
+import time
+import urllib.parse
 import urllib.request
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -18,36 +38,367 @@ PIPER_MODEL_URL_TEMPLATE = (
     "https://huggingface.co/rhasspy/piper-voices/resolve/main/{key}/{model_file}"
 )
 
+# Each download stream reads into one reusable buffer of this size
+_DOWNLOAD_CHUNK = 1 << 20
+# Large models are fetched as this many parallel Range requests; anything
+# smaller than two segments' worth goes over a single stream.
+_DOWNLOAD_SEGMENTS = 8
+_MIN_SEGMENT_BYTES = 4 << 20
+
+# Progress callbacks fire at most once per this many bytes or this interval
+# (whichever comes first), plus once at completion, not on every chunk
+_PROGRESS_MIN_BYTES = 1 << 20
+_PROGRESS_MIN_INTERVAL_S = 0.05
+
+# Whole-download attempts, with exponential backoff between them
+_DOWNLOAD_ATTEMPTS = 3
+_DOWNLOAD_BACKOFF_S = 1.0
+
+_CONTENT_RANGE_RE = re.compile(r"bytes 0-0/(\d+)")
+
+_USER_AGENT = "orion-voice"
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+# voices.json is repetitive JSON and compresses several times over
+_GZIP = {"Accept-Encoding": "gzip"}
+# How long a resolved host's addresses are reused for new connections
+_DNS_TTL_S = 300.0
+
+
+class _HTTPStatusError(OSError):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _validator(resp: http.client.HTTPResponse) -> Optional[str]:
+    """A strong ETag, else Last-Modified: what If-Range can be sent with."""
+    etag = resp.getheader("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return resp.getheader("Last-Modified")
+
+
+def _parts_path(tmp: Path) -> Path:
+    """Sidecar recording what a partial download in *tmp* came from and holds."""
+    return tmp.with_name(tmp.name + ".parts")
+
+
+class _ProgressThrottle:
+    """Accumulates downloaded bytes, possibly from several threads, and
+    forwards ``(downloaded, total)`` to *callback* at a bounded rate."""
+
+    def __init__(self, callback: callable, total: int) -> None:
+        self._callback = callback
+        self._total = total
+        self._done = 0
+        self._reported = 0
+        self._reported_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, n: int) -> None:
+        with self._lock:
+            self._done += n
+            now = time.monotonic()
+            if (
+                self._done >= self._total
+                or self._done - self._reported >= _PROGRESS_MIN_BYTES
+                or now - self._reported_at >= _PROGRESS_MIN_INTERVAL_S
+            ):
+                self._reported = self._done
+                self._reported_at = now
+                self._callback(self._done, self._total)
+
+
+class _HTTPPool:
+    """Keep-alive connections keyed by (scheme, host, port), safe to share across threads.
+
+    The voice list, the model (and its parallel ranges) and the config all come
+    from the same couple of hosts, so each TLS handshake is paid once. Host
+    lookups are cached too, so the burst of new connections a ranged download
+    opens shares one getaddrinfo().
+    """
+
+    def __init__(self, max_idle_per_host: int = _DOWNLOAD_SEGMENTS) -> None:
+        self._idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+        self._max_idle = max_idle_per_host
+        self._lock = threading.Lock()
+        self._dns: dict[tuple[str, int], tuple[float, list]] = {}
+        self._dns_lock = threading.Lock()
+        # HTTP(S)_PROXY / NO_PROXY, or the system settings on Windows and
+        # macOS, the same ones urlopen() honours
+        self._proxies = urllib.request.getproxies()
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[tuple[str, int, dict[str, str]]]:
+        """(proxy host, proxy port, auth headers) to reach *host* through, or None."""
+        proxy = self._proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host):
+            return None
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        parts = urllib.parse.urlsplit(proxy)
+        auth: dict[str, str] = {}
+        if parts.username is not None:
+            creds = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+            auth["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode()).decode("ascii")
+        return parts.hostname or "", parts.port or 80, auth
+
+    def _acquire(self, key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        return self._connect(key, timeout), False
+
+    def _connect(self, key: tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        proxy = self._proxy_for(scheme, host)
+        if proxy is None:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = cls(host, port, timeout=timeout)
+        elif scheme == "https":
+            # CONNECT tunnel through the proxy; TLS and SNI are still end to end
+            conn = http.client.HTTPSConnection(proxy[0], proxy[1], timeout=timeout)
+            conn.set_tunnel(host, port, headers=proxy[2])
+        else:
+            # Plain HTTP goes to the proxy with absolute request targets, see _send()
+            conn = http.client.HTTPConnection(proxy[0], proxy[1], timeout=timeout)
+        # http.client opens its socket through this hook; TLS wrapping and SNI
+        # still use the hostname.
+        conn._create_connection = self._create_connection  # type: ignore[attr-defined]
+        return conn
+
+    def _resolve(self, host: str, port: int) -> list:
+        now = time.monotonic()
+        with self._dns_lock:
+            cached = self._dns.get((host, port))
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            # Resolved under the lock so concurrent connects wait for one lookup
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            self._dns[(host, port)] = (now + _DNS_TTL_S, infos)
+            return infos
+
+    def _create_connection(self, address: tuple[str, int], timeout=None, source_address=None) -> socket.socket:
+        host, port = address
+        err: Optional[OSError] = None
+        for family, type_, proto, _, sockaddr in self._resolve(host, port):
+            sock = socket.socket(family, type_, proto)
+            try:
+                if isinstance(timeout, (int, float)):
+                    sock.settimeout(timeout)
+                if source_address:
+                    sock.bind(source_address)
+                sock.connect(sockaddr)
+                return sock
+            except OSError as exc:
+                err = exc
+                sock.close()
+        # Every cached address failed; look the host up again next time
+        with self._dns_lock:
+            self._dns.pop((host, port), None)
+        raise err or OSError(f"No addresses for {host}:{port}")
+
+    def _release(self, key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _send(
+        self, method: str, url: str, headers: dict[str, str], timeout: float
+    ) -> tuple[http.client.HTTPResponse, http.client.HTTPConnection, tuple[str, str, int]]:
+        parts = urllib.parse.urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname or "", port)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        headers = {"User-Agent": _USER_AGENT, **headers}
+        if parts.scheme == "http":
+            proxy = self._proxy_for("http", key[1])
+            if proxy is not None:
+                target = urllib.parse.urlunsplit(parts._replace(fragment=""))
+                headers.update(proxy[2])
+
+        conn, reused = self._acquire(key, timeout)
+        try:
+            conn.request(method, target, headers=headers)
+            return conn.getresponse(), conn, key
+        except (http.client.BadStatusLine, ConnectionError):
+            conn.close()
+            if not reused:
+                raise
+        # The server dropped an idle keep-alive connection; retry once on a new one
+        conn = self._connect(key, timeout)
+        try:
+            conn.request(method, target, headers=headers)
+            return conn.getresponse(), conn, key
+        except BaseException:
+            conn.close()
+            raise
+
+    @contextmanager
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        timeout: float = 30,
+    ) -> Iterator[tuple[http.client.HTTPResponse, str]]:
+        """Send a request, following redirects; yields (response, final URL).
+
+        Error statuses raise OSError. The connection goes back to the pool if
+        the body was read to the end, and is closed otherwise.
+        """
+        headers = headers or {}
+        for _ in range(_MAX_REDIRECTS + 1):
+            resp, conn, key = self._send(method, url, headers, timeout)
+            if resp.status not in _REDIRECT_STATUSES:
+                break
+            location = resp.getheader("Location")
+            resp.read()
+            self._release(key, conn)
+            if not location:
+                raise OSError(f"HTTP {resp.status} without a Location header from {url}")
+            url = urllib.parse.urljoin(url, location)
+        else:
+            raise OSError(f"Too many redirects fetching {url}")
+
+        try:
+            if resp.status >= 400:
+                raise _HTTPStatusError(resp.status, f"HTTP {resp.status} {resp.reason} fetching {url}")
+            yield resp, url
+        except BaseException:
+            conn.close()
+            raise
+        if resp.isclosed() and not resp.will_close:
+            self._release(key, conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
 
 class PiperVoiceManager:
     def __init__(self, models_dir: Optional[Path] = None) -> None:
         self.models_dir = models_dir or DEFAULT_MODELS_DIR
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self._remote_cache: Optional[dict] = None
+        self._http = _HTTPPool()
+        # name -> (model path, has .onnx.json), from one scandir walk. Rebuilt when
+        # the models dir's mtime moves (a voice dir added or removed) or after
+        # our own downloads.
+        self._index: Optional[dict[str, tuple[Path, bool]]] = None
+        self._index_mtime = 0
+        # voice key -> _index_files() of its remote file list, built on first use
+        self._file_index: dict[str, dict[tuple[str, Optional[str]], str]] = {}
+
+    def _get_index(self) -> dict[str, tuple[Path, bool]]:
+        try:
+            mtime = os.stat(self.models_dir).st_mtime_ns
+        except OSError:
+            mtime = 0
+        if self._index is None or mtime != self._index_mtime:
+            self._index = self._scan()
+            self._index_mtime = mtime
+        return self._index
+
+    def _scan(self) -> dict[str, tuple[Path, bool]]:
+        index: dict[str, tuple[Path, bool]] = {}
+        pending = [str(self.models_dir)]
+        while pending:
+            try:
+                it = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with it:
+                models: list[os.DirEntry] = []
+                names: set[str] = set()
+                for entry in it:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                        continue
+                    names.add(entry.name)
+                    if entry.name.endswith(".onnx"):
+                        models.append(entry)
+            # Config presence comes from the same listing, no per-model stat
+            for entry in models:
+                index.setdefault(entry.name[:-5], (Path(entry.path), entry.name + ".json" in names))
+        return index
 
     def list_installed(self) -> list[str]:
-        voices: list[str] = []
-        for onnx in self.models_dir.rglob("*.onnx"):
-            json_cfg = onnx.with_suffix(".onnx.json")
-            if json_cfg.exists():
-                voices.append(onnx.stem)
-        return sorted(voices)
+        return sorted(name for name, (_, has_config) in self._get_index().items() if has_config)
 
     def get_model_path(self, name: str) -> Optional[Path]:
-        for onnx in self.models_dir.rglob("*.onnx"):
-            if onnx.stem == name:
-                return onnx
-        return None
+        entry = self._get_index().get(name)
+        return entry[0] if entry else None
+
+    @property
+    def _voices_cache_path(self) -> Path:
+        return self.models_dir / "voices.json.cache"
+
+    def _read_voices_cache(self) -> tuple[Optional[str], Optional[bytes]]:
+        """The on-disk voices.json copy as (ETag, body), or (None, None)."""
+        try:
+            data = self._voices_cache_path.read_bytes()
+        except OSError:
+            return None, None
+        etag, sep, body = data.partition(b"\n")
+        if not sep:
+            return None, None
+        return etag.decode("latin-1") or None, body
+
+    def _write_voices_cache(self, etag: str, body: bytes) -> None:
+        tmp = self._voices_cache_path.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(etag.encode("latin-1") + b"\n" + body)
+            os.replace(tmp, self._voices_cache_path)
+        except OSError as exc:
+            logger.debug("Could not write voice list cache: %s", exc)
+            tmp.unlink(missing_ok=True)
 
     def fetch_remote_voices(self, timeout: int = 10) -> dict:
         if self._remote_cache is not None:
             return self._remote_cache
+        # Revalidate the copy on disk from a previous run; a 304 skips the body
+        etag, cached = self._read_voices_cache()
+        headers = dict(_GZIP)
+        if etag and cached is not None:
+            headers["If-None-Match"] = etag
         try:
-            req = urllib.request.Request(PIPER_VOICES_URL, headers={"User-Agent": "orion-voice"})
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                self._remote_cache = json.loads(resp.read())
+            with self._http.request("GET", PIPER_VOICES_URL, headers, timeout=timeout) as (resp, _):
+                body = resp.read()
+                if resp.status == 304 and cached is not None:
+                    body = cached
+                else:
+                    if resp.getheader("Content-Encoding") == "gzip":
+                        body = gzip.decompress(body)
+                    new_etag = resp.getheader("ETag")
+                    if new_etag:
+                        self._write_voices_cache(new_etag, body)
+                self._remote_cache = _json_loads(body)
                 return self._remote_cache  # type: ignore[return-value]
         except Exception as exc:
+            if cached is not None:
+                try:
+                    self._remote_cache = _json_loads(cached)
+                except ValueError:
+                    pass
+                else:
+                    logger.warning("Failed to refresh Piper voice list, using cached copy: %s", exc)
+                    return self._remote_cache  # type: ignore[return-value]
             logger.warning("Failed to fetch Piper voice list: %s", exc)
             return {}
 
@@ -61,23 +412,16 @@ class PiperVoiceManager:
         if voice_key not in voices:
             raise ValueError(f"Unknown voice: {voice_key}. Use list_remote_voices() to see options.")
 
-        info = voices[voice_key]
-        files = info.get("files", {})
+        index = self._file_index.get(voice_key)
+        if index is None:
+            index = self._file_index[voice_key] = self._index_files(voices[voice_key].get("files", {}))
 
-        model_entry = None
-        config_entry = None
-        for file_key, meta in files.items():
-            if quality in file_key and file_key.endswith(".onnx"):
-                model_entry = file_key
-            elif quality in file_key and file_key.endswith(".onnx.json"):
-                config_entry = file_key
-
-        if not model_entry:
-            for file_key in files:
-                if file_key.endswith(".onnx"):
-                    model_entry = file_key
-                elif file_key.endswith(".onnx.json"):
-                    config_entry = file_key
+        model_entry = index.get((".onnx", quality))
+        if model_entry:
+            config_entry = index.get((".onnx.json", quality))
+        else:
+            model_entry = index.get((".onnx", None))
+            config_entry = index.get((".onnx.json", None))
 
         if not model_entry:
             raise ValueError(f"No model file found for voice {voice_key}")
@@ -88,59 +432,311 @@ class PiperVoiceManager:
         model_filename = Path(model_entry).name
         dest_model = dest_dir / model_filename
 
+        jobs: list[tuple[str, Path, Optional[callable]]] = []
         if not dest_model.exists():
-            url = PIPER_MODEL_URL_TEMPLATE.format(key=voice_key, model_file=model_entry.split("/")[-1])
             full_url = f"https://huggingface.co/rhasspy/piper-voices/resolve/main/{model_entry}"
-            self._download_file(full_url, dest_model, progress_callback)
+            jobs.append((full_url, dest_model, progress_callback))
 
         if config_entry:
             config_filename = Path(config_entry).name
             dest_config = dest_dir / config_filename
             if not dest_config.exists():
                 full_url = f"https://huggingface.co/rhasspy/piper-voices/resolve/main/{config_entry}"
-                self._download_file(full_url, dest_config)
+                jobs.append((full_url, dest_config, None))
+
+        if len(jobs) > 1:
+            # The small config downloads alongside the model rather than after it
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(jobs), thread_name_prefix="piper-voice"
+            ) as pool:
+                futures = [pool.submit(self._download_file, *job) for job in jobs]
+                for fut in futures:
+                    fut.result()
+        elif jobs:
+            self._download_file(*jobs[0])
+        if jobs:
+            self._index = None
 
         return dest_model
 
     @staticmethod
+    def _index_files(files: dict) -> dict[tuple[str, Optional[str]], str]:
+        """Map (suffix, quality) and (suffix, None) to a voice's model/config file keys.
+
+        Keys look like ``en/en_US/amy/medium/en_US-amy-medium.onnx``; the quality
+        is the parent directory, so "low" no longer also matches "x_low".
+        Later entries win, and (suffix, None) holds the last of any quality.
+        """
+        index: dict[tuple[str, Optional[str]], str] = {}
+        for file_key in files:
+            if file_key.endswith(".onnx.json"):
+                suffix = ".onnx.json"
+            elif file_key.endswith(".onnx"):
+                suffix = ".onnx"
+            else:
+                continue
+            parts = file_key.rsplit("/", 2)
+            if len(parts) > 1:
+                index[(suffix, parts[-2])] = file_key
+            index[(suffix, None)] = file_key
+        return index
+
     def _download_file(
+        self,
         url: str,
         dest: Path,
         progress_callback: Optional[callable] = None,
+        segments: int = _DOWNLOAD_SEGMENTS,
     ) -> None:
         logger.info("Downloading %s -> %s", url, dest)
-        req = urllib.request.Request(url, headers={"User-Agent": "orion-voice"})
         tmp = dest.with_suffix(dest.suffix + ".tmp")
+        parts = _parts_path(tmp)
+        for attempt in range(_DOWNLOAD_ATTEMPTS):
+            try:
+                total, final_url, validator = self._probe_ranges(url)
+                if segments > 1 and total >= 2 * _MIN_SEGMENT_BYTES:
+                    self._download_ranges(final_url, tmp, total, segments, validator, progress_callback)
+                else:
+                    self._download_single(url, tmp, total, validator, progress_callback)
+                # tmp sits next to dest, so this is always a same-filesystem rename
+                os.replace(tmp, dest)
+                parts.unlink(missing_ok=True)
+                return
+            except Exception as exc:
+                retryable = isinstance(exc, (OSError, http.client.HTTPException)) and not (
+                    isinstance(exc, _HTTPStatusError) and exc.status < 500
+                )
+                if not retryable:
+                    tmp.unlink(missing_ok=True)
+                    parts.unlink(missing_ok=True)
+                    raise
+                # Otherwise tmp and its sidecar stay, for the next attempt (or
+                # the next download_voice call) to resume from
+                if attempt == _DOWNLOAD_ATTEMPTS - 1:
+                    raise
+                delay = _DOWNLOAD_BACKOFF_S * (2 ** attempt)
+                logger.warning("Download of %s failed (%s); retrying in %.0f s", url, exc, delay)
+                time.sleep(delay)
+
+    def _probe_ranges(self, url: str) -> tuple[int, str, Optional[str]]:
+        """Return (size, post-redirect URL, validator) if the server honours
+        byte ranges, else (0, url, None)."""
         try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
-                total = int(resp.headers.get("Content-Length", 0))
-                downloaded = 0
-                with open(tmp, "wb") as f:
-                    while True:
-                        chunk = resp.read(1 << 16)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if progress_callback and total:
-                            progress_callback(downloaded, total)
-            shutil.move(str(tmp), str(dest))
-        except Exception:
-            tmp.unlink(missing_ok=True)
-            raise
+            with self._http.request("GET", url, {"Range": "bytes=0-0"}) as (resp, final_url):
+                match = _CONTENT_RANGE_RE.fullmatch(resp.getheader("Content-Range", ""))
+                resp.read()
+                if resp.status != 206 or match is None:
+                    return 0, url, None
+                # Hugging Face redirects to its CDN; range requests go straight there
+                return int(match.group(1)), final_url, _validator(resp)
+        except Exception as exc:
+            logger.debug("Range probe failed for %s: %s", url, exc)
+            return 0, url, None
+
+    @staticmethod
+    def _read_parts(parts: Path) -> tuple[Optional[str], set[int]]:
+        """A sidecar's header line and the finished segment offsets listed after it."""
+        try:
+            lines = parts.read_text("latin-1").splitlines()
+        except OSError:
+            return None, set()
+        if not lines:
+            return None, set()
+        return lines[0], {int(line) for line in lines[1:] if line.isdigit()}
+
+    @staticmethod
+    def _start_parts(parts: Path, header: Optional[str]) -> None:
+        if header is None:
+            parts.unlink(missing_ok=True)
+        else:
+            parts.write_text(header + "\n", "latin-1")
+
+    def _download_single(
+        self,
+        url: str,
+        tmp: Path,
+        total: int,
+        validator: Optional[str],
+        progress_callback: Optional[callable],
+    ) -> None:
+        """Stream *url* into *tmp* and check the final length.
+
+        A partial *tmp* from an earlier attempt is resumed with If-Range, so
+        it is only appended to if the file on the server hasn't changed.
+        """
+        parts = _parts_path(tmp)
+        offset = 0
+        if total and validator and self._read_parts(parts)[0] == f"{total} 0 {validator}":
+            try:
+                offset = tmp.stat().st_size
+            except FileNotFoundError:
+                pass
+            if offset > total:
+                offset = 0
+            elif offset == total:
+                return
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset else {}
+
+        with self._http.request("GET", url, headers, timeout=120) as (resp, _):
+            if resp.status != 206:
+                # Fresh download, or the server's copy changed: start over
+                offset = 0
+                total = int(resp.getheader("Content-Length", 0))
+                fresh = _validator(resp)
+                self._start_parts(parts, f"{total} 0 {fresh}" if total and fresh else None)
+            else:
+                logger.info("Resuming %s at byte %d of %d", url, offset, total)
+            progress = _ProgressThrottle(progress_callback, total) if progress_callback and total else None
+            if progress and offset:
+                progress.add(offset)
+            written = offset
+            view = memoryview(bytearray(_DOWNLOAD_CHUNK))
+            with open(tmp, "ab" if offset else "wb") as f:
+                while True:
+                    n = resp.readinto(view)
+                    if not n:
+                        break
+                    f.write(view[:n])
+                    written += n
+                    if progress:
+                        progress.add(n)
+        if total and written != total:
+            raise OSError(f"Download of {url} ended at {written} of {total} bytes")
+
+    def _download_ranges(
+        self,
+        url: str,
+        tmp: Path,
+        total: int,
+        segments: int,
+        validator: Optional[str],
+        progress_callback: Optional[callable],
+    ) -> None:
+        """Fetch *total* bytes as *segments* parallel Range requests into a presized *tmp*.
+
+        Each finished segment is appended to a sidecar file, so a retry only
+        fetches the segments an earlier attempt didn't complete.
+        """
+        step = -(-total // segments)
+        bounds = [(a, min(a + step, total) - 1) for a in range(0, total, step)]
+        parts = _parts_path(tmp)
+        header = f"{total} {step} {validator}" if validator else None
+
+        finished: set[int] = set()
+        if header is not None:
+            saved, finished = self._read_parts(parts)
+            try:
+                if saved != header or tmp.stat().st_size != total:
+                    finished = set()
+            except FileNotFoundError:
+                finished = set()
+        if finished:
+            logger.info("Resuming %s with %d of %d segments done", url, len(finished), len(bounds))
+        else:
+            with open(tmp, "wb") as f:
+                f.truncate(total)
+            self._start_parts(parts, header)
+        pending = [(a, b) for a, b in bounds if a not in finished]
+        if not pending:
+            return
+
+        failed = threading.Event()
+        parts_lock = threading.Lock()
+        progress = _ProgressThrottle(progress_callback, total) if progress_callback else None
+        if progress and finished:
+            progress.add(total - sum(b - a + 1 for a, b in pending))
+
+        def _fetch(start: int, end: int) -> None:
+            headers = {"Range": f"bytes={start}-{end}"}
+            if validator:
+                headers["If-Range"] = validator
+            # Each worker writes its own slice through its own handle
+            with self._http.request("GET", url, headers, timeout=120) as (resp, _), open(tmp, "r+b") as f:
+                if resp.status != 206:
+                    raise OSError(f"Server ignored range request (HTTP {resp.status})")
+                f.seek(start)
+                view = memoryview(bytearray(_DOWNLOAD_CHUNK))
+                remaining = end - start + 1
+                while remaining > 0:
+                    if failed.is_set():
+                        return
+                    n = resp.readinto(view[:remaining])
+                    if not n:
+                        raise OSError(f"Connection closed with {remaining} bytes left in range {start}-{end}")
+                    f.write(view[:n])
+                    remaining -= n
+                    if progress:
+                        progress.add(n)
+            if header is not None:
+                with parts_lock, open(parts, "a", encoding="latin-1") as p:
+                    p.write(f"{start}\n")
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(pending), thread_name_prefix="piper-download"
+        ) as pool:
+            futures = [pool.submit(_fetch, a, b) for a, b in pending]
+            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            for fut in done:
+                if fut.exception() is not None:
+                    failed.set()
+                    raise fut.exception()  # type: ignore[misc]
 
     def delete_voice(self, name: str) -> bool:
-        path = self.get_model_path(name)
-        if path is None:
+        entry = self._get_index().get(name)
+        if entry is None:
             return False
+        path, has_config = entry
+        # The index already knows the voice's files, so remove just those
+        # and the directory rather than walking it with rmtree
+        files = [path, path.with_name(path.name + ".json")] if has_config else [path]
+        for file in files:
+            try:
+                os.unlink(file)
+            except FileNotFoundError:
+                pass
         parent = path.parent
-        shutil.rmtree(parent, ignore_errors=True)
+        if parent != self.models_dir:
+            try:
+                os.rmdir(parent)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Something else was left in the voice directory
+                shutil.rmtree(parent, ignore_errors=True)
+        self._index = None
         return True
 
+    def _stream_remote_voices(self, language: str, timeout: int = 10) -> list[tuple[str, dict]]:
+        """Parse voices.json as it downloads, keeping only *language* entries."""
+        try:
+            with self._http.request("GET", PIPER_VOICES_URL, _GZIP, timeout=timeout) as (resp, _):
+                src = gzip.GzipFile(fileobj=resp) if resp.getheader("Content-Encoding") == "gzip" else resp
+                return [
+                    (key, info)
+                    for key, info in ijson.kvitems(src, "")
+                    if info.get("language", {}).get("code", "").startswith(language)
+                ]
+        except Exception as exc:
+            logger.warning("Failed to fetch Piper voice list: %s", exc)
+            return []
+
     def list_remote_voices(self, language: Optional[str] = None) -> list[dict]:
-        voices = self.fetch_remote_voices()
+        # A filtered listing stream-parses when it can, so the other languages'
+        # entries are dropped one at a time instead of all held in one dict.
+        # download_voice(), and any run with a disk copy to revalidate, go
+        # through the full, cached dict.
+        items: Iterable[tuple[str, dict]]
+        if (
+            language
+            and self._remote_cache is None
+            and ijson is not None
+            and not self._voices_cache_path.exists()
+        ):
+            items = self._stream_remote_voices(language)
+        else:
+            items = self.fetch_remote_voices().items()
         results: list[dict] = []
-        for key, info in voices.items():
+        for key, info in items:
             lang = info.get("language", {})
             lang_code = lang.get("code", "")
             if language and not lang_code.startswith(language):
@@ -155,26 +751,68 @@ class PiperVoiceManager:
         return results
 
 
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """One long-lived event loop thread for edge-tts calls made from sync code,
+    instead of building and tearing down a loop per call with asyncio.run()."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True, name="edge-voices-loop").start()
+            _bg_loop = loop
+        return _bg_loop
+
+
 class EdgeVoiceLister:
+    # The Edge catalogue is effectively static, so one fetch serves every
+    # caller in the process for an hour
+    CACHE_TTL_S = 3600.0
+    # (fetched at, full list, voices by locale and by language prefix)
+    _cache: Optional[tuple[float, list[dict], dict[str, list[dict]]]] = None
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def list_voices(cls, language: Optional[str] = None) -> list[dict]:
+        all_voices, by_prefix = cls._catalogue()
+        if not language:
+            return list(all_voices)
+        hit = by_prefix.get(language)
+        if hit is not None:
+            return list(hit)
+        return [v for v in all_voices if v.get("Locale", "").startswith(language)]
+
+    @classmethod
+    def _catalogue(cls) -> tuple[list[dict], dict[str, list[dict]]]:
+        with cls._cache_lock:
+            cached = cls._cache
+            if cached is not None and time.monotonic() - cached[0] < cls.CACHE_TTL_S:
+                return cached[1], cached[2]
+            all_voices = cls._fetch()
+            # "en-US" and "en" lookups are then a dict hit instead of a scan
+            by_prefix: dict[str, list[dict]] = {}
+            for voice in all_voices:
+                locale = voice.get("Locale", "")
+                lang = locale.split("-", 1)[0]
+                by_prefix.setdefault(locale, []).append(voice)
+                if lang != locale:
+                    by_prefix.setdefault(lang, []).append(voice)
+            cls._cache = (time.monotonic(), all_voices, by_prefix)
+            return all_voices, by_prefix
+
     @staticmethod
-    def list_voices(language: Optional[str] = None) -> list[dict]:
+    def _fetch() -> list[dict]:
         import edge_tts
 
-        async def _fetch() -> list[dict]:
-            all_voices = await edge_tts.list_voices()
-            if language:
-                return [v for v in all_voices if v.get("Locale", "").startswith(language)]
-            return all_voices
-
+        future = asyncio.run_coroutine_threadsafe(edge_tts.list_voices(), _get_bg_loop())
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop and loop.is_running():
-            future = asyncio.run_coroutine_threadsafe(_fetch(), loop)
             return future.result(timeout=10)
-        return asyncio.run(_fetch())
+        except BaseException:
+            future.cancel()
+            raise
 
 
 def preview_voice(
@@ -201,25 +839,18 @@ def preview_voice(
         import sounddevice as sd
         import numpy as np
 
-        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
-        sd.play(samples, samplerate=sr, blocking=True)
+        # PortAudio takes int16 as-is; no float32 copy or scaling pass
+        sd.play(np.frombuffer(pcm, dtype=np.int16), samplerate=sr, blocking=True)
     except ImportError:
         import pygame
 
-        if not pygame.mixer.get_init():
+        # Raw s16le goes to the mixer as-is, with no WAV wrapper; that needs
+        # the mixer running at exactly this rate and format
+        if pygame.mixer.get_init() != (sr, -16, 1):
+            pygame.mixer.quit()
             pygame.mixer.init(frequency=sr, size=-16, channels=1)
 
-        import io
-        import wave
-
-        buf = io.BytesIO()
-        with wave.open(buf, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sr)
-            wf.writeframes(pcm)
-        buf.seek(0)
-        sound = pygame.mixer.Sound(buf)
+        sound = pygame.mixer.Sound(buffer=pcm)
         sound.play()
         while pygame.mixer.get_busy():
             pygame.time.wait(50)